@@ -22,7 +22,7 @@ from .config_loader import (
     DEFAULT_FOCUS_TOPICS,
     DEFAULT_VOICE_DESCRIPTION,
     _deep_merge_dicts,
-    _parse_yaml_subset,
+    _load_optional_global_defaults,
     default_global_defaults_path,
     load_repo_config,
     load_secrets,
@@ -33,7 +33,7 @@ from .git_cli import ensure_git_repo, get_branch_name, get_head_sha
 from .lockfile import exclusive_lock
 from .operator import answer_question, run_chat
 from .process_loop import run_daemon, run_once
-from .scaffold import bootstrap_repo
+from .scaffold import _write_text_atomic, _yaml_quote, bootstrap_repo
 from .state_manager import load_state, reset_state, state_path
 from .template_loader import load_templates, missing_standard_templates
 
@@ -46,8 +46,8 @@ def _add_config_arg(parser: argparse.ArgumentParser) -> None:
     )
 
 
-def _discover_config_path() -> str:
-    cwd = Path.cwd().resolve()
+def _discover_config_path(cwd: Path | None = None) -> str:
+    cwd = (cwd or Path.cwd()).resolve()
     for parent in (cwd, *cwd.parents):
         candidate = parent / DEFAULT_CONFIG_PATH
         if candidate.is_file():
@@ -55,10 +55,19 @@ def _discover_config_path() -> str:
     return str(cwd / DEFAULT_CONFIG_PATH)
 
 
-def _resolve_config_path(config_path: str | None) -> str:
+def _resolve_config_path(config_path: str | None, cwd: Path | None = None) -> str:
     if isinstance(config_path, str) and config_path.strip():
-        return config_path
-    return _discover_config_path()
+        if cwd is None:
+            return config_path
+        return str(_from_cwd(config_path, cwd))
+    return _discover_config_path(cwd)
+
+
+def _from_cwd(path_value: str, cwd: Path | None) -> Path:
+    path = Path(path_value).expanduser()
+    if cwd is None or path.is_absolute():
+        return path
+    return cwd / path
 
 
 def _add_bootstrap_args(parser: argparse.ArgumentParser) -> None:
@@ -240,10 +249,6 @@ def cmd_chat(config_path: str) -> int:
     return run_chat(config_path)
 
 
-def _yaml_quote(text: str) -> str:
-    return '"' + text.replace("\\", "\\\\").replace('"', '\\"') + '"'
-
-
 def _wizard_base_defaults() -> dict[str, object]:
     return {
         "poll_interval_seconds": 60,
@@ -296,15 +301,7 @@ def _normalize_wizard_defaults(raw: dict[str, object]) -> dict[str, object]:
 
 
 def _load_existing_global_defaults() -> dict[str, object]:
-    defaults_path = default_global_defaults_path()
-    if not defaults_path.exists():
-        return {}
-    if not defaults_path.is_file():
-        raise ShipnoteConfigError(f"Global defaults path is not a file: {defaults_path}")
-    parsed = _parse_yaml_subset(defaults_path)
-    if not isinstance(parsed, dict):
-        raise ShipnoteConfigError(f"Global defaults root must be an object: {defaults_path}")
-    return parsed
+    return _load_optional_global_defaults(default_global_defaults_path())
 
 
 def _prompt_text(label: str, default: str) -> str:
@@ -371,12 +368,6 @@ def _run_config_wizard(defaults: dict[str, object]) -> dict[str, object]:
     }
 
 
-def _write_text_atomic(path: Path, content: str) -> None:
-    temp = path.with_suffix(path.suffix + ".tmp")
-    temp.write_text(content, encoding="utf-8")
-    temp.replace(path)
-
-
 def cmd_setup() -> int:
     existing = _load_existing_global_defaults()
     values = _run_config_wizard(existing)
@@ -470,9 +461,9 @@ def cmd_config(args: argparse.Namespace) -> int:
     raise ShipnoteError(f"Unknown config subcommand: {args.config_command}")
 
 
-def _bootstrap_from_args(args: argparse.Namespace) -> Path:
+def _bootstrap_from_args(args: argparse.Namespace, cwd: Path | None = None) -> Path:
     result = bootstrap_repo(
-        repo_path=Path(args.repo),
+        repo_path=_from_cwd(args.repo, cwd),
         project_name=args.project_name,
         project_description=args.project_description,
         voice_description=args.voice_description,
@@ -492,8 +483,8 @@ def _bootstrap_from_args(args: argparse.Namespace) -> Path:
     return result.config_path
 
 
-def cmd_init(args: argparse.Namespace) -> int:
-    repo_path = Path.cwd().resolve()
+def cmd_init(args: argparse.Namespace, cwd: Path | None = None) -> int:
+    repo_path = (cwd or Path.cwd()).resolve()
     try:
         ensure_git_repo(repo_path)
     except Exception as exc:
@@ -528,18 +519,19 @@ def cmd_init(args: argparse.Namespace) -> int:
     return 0
 
 
-def cmd_launch(args: argparse.Namespace) -> int:
-    config_path = _bootstrap_from_args(args)
+def cmd_launch(args: argparse.Namespace, cwd: Path | None = None) -> int:
+    config_path = _bootstrap_from_args(args, cwd)
     cmd_check(str(config_path))
     print("launch: starting daemon loop (Ctrl+C to stop)")
     return run_daemon(str(config_path))
 
 
-def main(argv: list[str] | None = None) -> int:
+def main(argv: list[str] | None = None, *, cwd: Path | None = None) -> int:
+    """Run the CLI; ``cwd`` overrides the process working directory for path lookups."""
     parser = build_parser()
     args = parser.parse_args(argv)
     if hasattr(args, "config") and args.command not in {"init"}:
-        args.config = _resolve_config_path(args.config)
+        args.config = _resolve_config_path(args.config, cwd)
 
     try:
         if args.command == "start":
@@ -561,9 +553,9 @@ def main(argv: list[str] | None = None) -> int:
         if args.command == "config":
             return cmd_config(args)
         if args.command == "init":
-            return cmd_init(args)
+            return cmd_init(args, cwd)
         if args.command == "launch":
-            return cmd_launch(args)
+            return cmd_launch(args, cwd)
         parser.error(f"Unknown command: {args.command}")
         return 2
     except ShipnoteError as exc:
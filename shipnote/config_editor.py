@@ -10,10 +10,7 @@ from typing import Any
 
 from . import config_loader
 from .errors import ShipnoteConfigError
-
-
-def _yaml_quote(value: str) -> str:
-    return '"' + value.replace("\\", "\\\\").replace('"', '\\"') + '"'
+from .scaffold import _yaml_quote
 
 
 def _scalar_to_yaml(value: Any) -> str:
@@ -168,7 +165,7 @@ def _validate_and_write(path: Path, raw_config: dict[str, Any]) -> None:
     try:
         temp.write_text(rendered, encoding="utf-8")
         # Ensure serialized output is parseable by current loader before replace.
-        config_loader.load_repo_config(str(temp))
+        config_loader.load_repo_config(str(temp), cache=False)
         temp.replace(path)
     except Exception as exc:
         if temp.exists():
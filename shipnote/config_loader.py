@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import copy
 import os
 import re
 import stat
 from dataclasses import dataclass, field
+from fnmatch import translate as _glob_to_regex
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -83,16 +86,45 @@ SHIPNOTE_PROVIDER_MAP = {
 }
 
 
-@dataclass(frozen=True)
+def _compile_patterns(patterns: list[str], flags: int = 0) -> tuple[re.Pattern[str], ...]:
+    """Compile regex strings once, skipping any that do not compile.
+
+    Config loading rejects invalid patterns; the skip only guards configs built by hand.
+    """
+    compiled: list[re.Pattern[str]] = []
+    for pattern in patterns:
+        try:
+            compiled.append(re.compile(pattern, flags))
+        except re.error:
+            continue
+    return tuple(compiled)
+
+
+def _compile_globs(patterns: list[str]) -> re.Pattern[str] | None:
+    """Fold fnmatch-style globs into one regex; match it against ``os.path.normcase(path)``."""
+    if not patterns:
+        return None
+    return re.compile("|".join(_glob_to_regex(os.path.normcase(pattern)) for pattern in patterns))
+
+
+@dataclass(frozen=True, slots=True)
 class SkipPatternsConfig:
     """Heuristic skip-pattern settings from config."""
 
     messages: list[str]
     files_only: list[str]
     min_meaningful_files: int
+    compiled_messages: tuple[re.Pattern[str], ...] = field(init=False, repr=False, compare=False)
+    compiled_files_only: re.Pattern[str] | None = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self, "compiled_messages", _compile_patterns(self.messages, re.IGNORECASE)
+        )
+        object.__setattr__(self, "compiled_files_only", _compile_globs(self.files_only))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ContentBalanceConfig:
     """Content balance percentages from config."""
 
@@ -110,7 +142,7 @@ class ContentBalanceConfig:
         }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ContextConfig:
     """Additional context-file settings from config."""
 
@@ -118,7 +150,7 @@ class ContextConfig:
     max_total_chars: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ContentPolicyConfig:
     """Content policy settings from config."""
 
@@ -127,7 +159,7 @@ class ContentPolicyConfig:
     engagement_reminder: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TemplatePreferencesConfig:
     """Template preference settings from config."""
 
@@ -135,7 +167,7 @@ class TemplatePreferencesConfig:
     is_thread_eligible_by_template: dict[str, bool]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RepoConfig:
     """Resolved repository-level config paths and settings."""
 
@@ -174,9 +206,17 @@ class RepoConfig:
             is_thread_eligible_by_template=dict(DEFAULT_TEMPLATE_THREAD_ELIGIBLE_BY_TEMPLATE),
         )
     )
+    compiled_secret_patterns: tuple[re.Pattern[str], ...] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self, "compiled_secret_patterns", _compile_patterns(self.secret_patterns)
+        )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SecretsConfig:
     """Resolved secrets file and parsed env values."""
 
@@ -254,18 +294,38 @@ def _deep_merge_dicts(base: dict[str, Any], overlay: dict[str, Any]) -> dict[str
     return merged
 
 
-def _load_optional_global_defaults() -> dict[str, Any]:
-    path = default_global_defaults_path()
-    if not path.exists():
+def _file_fingerprint(path: Path) -> tuple[int, int, int] | None:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+def _load_optional_global_defaults(path: Path | None = None) -> dict[str, Any]:
+    if path is None:
+        path = default_global_defaults_path()
+    fingerprint = _file_fingerprint(path)
+    if fingerprint is None:
         return {}
     if not path.is_file():
         raise ShipnoteConfigError(f"Global defaults path is not a file: {path}")
+    # Hand out a copy so callers cannot mutate the cached parse.
+    return copy.deepcopy(_parse_global_defaults_cached(path, fingerprint))
+
+
+@lru_cache(maxsize=16)
+def _parse_global_defaults_cached(path: Path, fingerprint: tuple[int, int, int]) -> dict[str, Any]:
     parsed = _parse_yaml_subset(path)
     if not isinstance(parsed, dict):
         raise ShipnoteConfigError(f"Global defaults root must be an object: {path}")
     return parsed
 
 
+_BOOL_LITERALS = frozenset({"true", "false"})
+_INT_LITERAL_RE = re.compile(r"-?\d+")
+
+
 def _strip_quotes(value: str) -> str:
     if len(value) >= 2 and value[0] == value[-1] and value[0] in {"'", '"'}:
         return value[1:-1]
@@ -273,6 +333,8 @@ def _strip_quotes(value: str) -> str:
 
 
 def _strip_inline_comment(value: str) -> str:
+    if "#" not in value:
+        return value.rstrip()
     in_single = False
     in_double = False
     escaped = False
@@ -305,17 +367,18 @@ def _parse_scalar(value: str) -> Any:
     if raw == "":
         return ""
     lowered = raw.lower()
-    if lowered in {"true", "false"}:
+    if lowered in _BOOL_LITERALS:
         return lowered == "true"
-    if re.fullmatch(r"-?\d+", raw):
+    if _INT_LITERAL_RE.fullmatch(raw):
         return int(raw)
     return raw
 
 
-def _collect_yaml_lines(path: Path) -> list[tuple[int, int, str]]:
+def _collect_yaml_lines(raw_text: str, path: Path) -> list[tuple[int, int, str]]:
     entries: list[tuple[int, int, str]] = []
-    for line_no, raw_line in enumerate(path.read_text(encoding="utf-8").splitlines(), start=1):
-        if raw_line.lstrip().startswith("#") or not raw_line.strip():
+    for line_no, raw_line in enumerate(raw_text.splitlines(), start=1):
+        stripped = raw_line.lstrip()
+        if not stripped or stripped[0] == "#":
             continue
         leading = len(raw_line) - len(raw_line.lstrip(" "))
         if "\t" in raw_line[:leading]:
@@ -333,7 +396,12 @@ def _collect_yaml_lines(path: Path) -> list[tuple[int, int, str]]:
 
 def _parse_yaml_subset(path: Path) -> dict[str, Any]:
     """Parse a constrained YAML subset sufficient for Shipnote config."""
-    entries = _collect_yaml_lines(path)
+    return _parse_yaml_text(path.read_text(encoding="utf-8"), path)
+
+
+def _parse_yaml_text(raw_text: str, path: Path) -> dict[str, Any]:
+    """Parse YAML subset text; ``path`` is only used in error messages."""
+    entries = _collect_yaml_lines(raw_text, path)
     root: dict[str, Any] = {}
     stack: list[tuple[int, dict[str, Any] | list[Any]]] = [(-1, root)]
 
@@ -630,8 +698,19 @@ def _validate_repo_config(raw: dict[str, Any], repo_root: Path, config_path: Pat
     )
 
 
-def load_repo_config(config_path_str: str) -> RepoConfig:
-    """Load and validate repo config."""
+def load_repo_config(config_path_str: str, *, cache: bool = True) -> RepoConfig:
+    """Load and validate repo config.
+
+    Results are cached per config file and global defaults file, keyed on their
+    stat fingerprints, so repeat loads of unchanged files skip parsing. Each
+    call returns a deep copy of the cached config, so callers may mutate it
+    without affecting later loads.
+    The fingerprint is ``(mtime_ns, size, inode)``, so an in-place edit that keeps
+    the file size and lands within one filesystem timestamp tick of the cached
+    load is not noticed until the file changes again or the cache is cleared.
+    Pass ``cache=False`` for one-off files (such as a pending ``.tmp`` write) so
+    they are parsed fresh and never enter the cache.
+    """
     config_path = Path(config_path_str).expanduser().resolve()
     if not config_path.exists():
         raise ShipnoteConfigError(
@@ -640,12 +719,66 @@ def load_repo_config(config_path_str: str) -> RepoConfig:
     if not config_path.is_file():
         raise ShipnoteConfigError(f"Config path is not a file: {config_path}")
 
-    repo_root = resolve_repo_root(config_path)
-    built_in = _default_repo_config_values(repo_root)
-    global_defaults = _load_optional_global_defaults()
-    repo_raw = _parse_yaml_subset(config_path)
+    defaults_path = default_global_defaults_path()
+    if not cache:
+        return _load_repo_config_uncached(config_path, defaults_path)
+    cached = _load_repo_config_cached(
+        config_path,
+        _file_fingerprint(config_path),
+        defaults_path,
+        _file_fingerprint(defaults_path),
+    )
+    return copy.deepcopy(cached)
+
+
+def clear_repo_config_cache() -> None:
+    """Drop all cached repo configs and global defaults."""
+    _load_repo_config_cached.cache_clear()
+    _parse_global_defaults_cached.cache_clear()
+
+
+@lru_cache(maxsize=32)
+def _load_repo_config_cached(
+    config_path: Path,
+    config_fingerprint: tuple[int, int, int] | None,
+    defaults_path: Path,
+    defaults_fingerprint: tuple[int, int, int] | None,
+) -> RepoConfig:
+    return _load_repo_config_uncached(config_path, defaults_path)
+
+
+def _load_repo_config_uncached(config_path: Path, defaults_path: Path) -> RepoConfig:
+    return _build_repo_config(
+        _parse_yaml_subset(config_path),
+        resolve_repo_root(config_path),
+        config_path,
+        _load_optional_global_defaults(defaults_path),
+    )
+
+
+def load_repo_config_from_text(text: str, *, repo_root: Path) -> RepoConfig:
+    """Validate repo config YAML held in memory.
 
-    merged = _deep_merge_dicts(built_in, global_defaults)
+    The text is treated as if it lived at ``DEFAULT_CONFIG_PATH`` under
+    ``repo_root``; global defaults apply exactly as for ``load_repo_config``.
+    """
+    repo_root = repo_root.expanduser().resolve()
+    config_path = repo_root / DEFAULT_CONFIG_PATH
+    return _build_repo_config(
+        _parse_yaml_text(text, config_path),
+        repo_root,
+        config_path,
+        _load_optional_global_defaults(),
+    )
+
+
+def _build_repo_config(
+    repo_raw: dict[str, Any],
+    repo_root: Path,
+    config_path: Path,
+    global_defaults: dict[str, Any],
+) -> RepoConfig:
+    merged = _deep_merge_dicts(_default_repo_config_values(repo_root), global_defaults)
     merged = _deep_merge_dicts(merged, repo_raw)
     return _validate_repo_config(merged, repo_root, config_path)
 
@@ -655,17 +788,16 @@ def default_secrets_path() -> Path:
     return (Path.home() / ".shipnote" / "secrets.env").expanduser().resolve()
 
 
+_ENV_LINE_RE = re.compile(
+    r"^[^\S\n]*([^\s#=\\'\"][^#=\n\\'\"]*?)[^\S\n]*=([^\n]*)$",
+    re.MULTILINE,
+)
+
+
 def _parse_env_file(path: Path) -> dict[str, str]:
     values: dict[str, str] = {}
-    for line in path.read_text(encoding="utf-8").splitlines():
-        raw = _strip_inline_comment(line.strip())
-        if not raw or "=" not in raw:
-            continue
-        key, value = raw.split("=", 1)
-        key = key.strip()
-        if not key:
-            continue
-        values[key] = _strip_quotes(value.strip())
+    for match in _ENV_LINE_RE.finditer(path.read_text(encoding="utf-8")):
+        values[match.group(1)] = _strip_quotes(_strip_inline_comment(match.group(2)).strip())
     return values
 
 
@@ -54,16 +54,15 @@ def _saveable_reminder(state: dict[str, Any]) -> str:
     return "0 saveable (Translation) pieces generated this week. Target: 1/week. Consider translation content."
 
 
-def _resolve_additional_context_path(repo_cfg: RepoConfig, path_value: str) -> Path:
+def _resolve_additional_context_path(repo_root: Path, shipnote_root: Path, path_value: str) -> Path:
+    """Resolve and sandbox-check one note path; both roots must already be resolved."""
     rel = Path(path_value.strip())
     if rel.is_absolute():
         raise ShipnoteConfigError(
             f"Context additional file must be a relative path under .shipnote: {path_value}"
         )
 
-    resolved = (repo_cfg.repo_root / rel).resolve()
-    repo_root = repo_cfg.repo_root.resolve()
-    shipnote_root = repo_cfg.shipnote_dir.resolve()
+    resolved = (repo_root / rel).resolve()
 
     try:
         resolved.relative_to(repo_root)
@@ -91,28 +90,30 @@ def _resolve_additional_context_path(repo_cfg: RepoConfig, path_value: str) -> P
 def _load_additional_notes(repo_cfg: RepoConfig) -> list[dict[str, str]]:
     remaining = max(0, int(repo_cfg.context.max_total_chars))
     notes: list[dict[str, str]] = []
+    repo_root = repo_cfg.repo_root.resolve()
+    shipnote_root = repo_cfg.shipnote_dir.resolve()
 
+    # Resolve and sandbox-check on every call: a note may be swapped for a symlink at any time.
     for path_value in repo_cfg.context.additional_files:
-        resolved = _resolve_additional_context_path(repo_cfg, path_value)
+        resolved = _resolve_additional_context_path(repo_root, shipnote_root, path_value)
         if remaining <= 0:
             break
         if not resolved.exists() or not resolved.is_file():
             continue
 
         try:
-            content = resolved.read_text(encoding="utf-8")
+            # Read at most the remaining budget instead of the whole file.
+            with resolved.open("r", encoding="utf-8") as fh:
+                content = fh.read(remaining)
         except UnicodeDecodeError as exc:
             raise ShipnoteConfigError(
                 f"Context additional file is not valid UTF-8: {path_value}"
             ) from exc
 
-        if len(content) > remaining:
-            content = content[:remaining]
         if not content:
             continue
 
-        canonical = resolved.relative_to(repo_cfg.repo_root.resolve()).as_posix()
-        notes.append({"path": canonical, "content": content})
+        notes.append({"path": resolved.relative_to(repo_root).as_posix(), "content": content})
         remaining -= len(content)
 
     return notes
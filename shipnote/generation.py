@@ -36,6 +36,17 @@ ALLOWED_SIGNALS = {
     "copy_link",
     "dm_share",
 }
+PRETTY_CONTEXT_ENV = "SHIPNOTE_PRETTY_CTX"
+_CODE_BLOCK_RE = re.compile(r"```(?:json)?\s*\n?(.*?)\n?\s*```", re.DOTALL)
+_JSON_STRUCTURAL_RE = re.compile(r'[{}"\\]')
+
+
+def _dump_compact(context: dict[str, Any]) -> str:
+    """Serialize generation context as compact JSON unless pretty output is requested."""
+    if os.getenv(PRETTY_CONTEXT_ENV, "").strip():
+        return json.dumps(context, indent=2, ensure_ascii=True)
+    return json.dumps(context, ensure_ascii=True, separators=(",", ":"))
+
 
 def _build_user_prompt(
     repo_cfg: RepoConfig,
@@ -53,7 +64,7 @@ def _build_user_prompt(
         f"project_description: {repo_cfg.project_description}\n"
         f"voice_description: {repo_cfg.voice_description}\n\n"
         "## Context\n\n"
-        f"{json.dumps(context, indent=2, ensure_ascii=True)}\n\n"
+        f"{_dump_compact(context)}\n\n"
         "## Available Templates\n\n"
         + "\n\n".join(template_sections)
         + "\n\n## Instructions\n\n"
@@ -76,7 +87,7 @@ def _build_user_prompt(
 
 
 def _extract_json_object(text: str) -> str:
-    code_block_match = re.search(r"```(?:json)?\s*\n?(.*?)\n?\s*```", text, re.DOTALL)
+    code_block_match = _CODE_BLOCK_RE.search(text)
     if code_block_match:
         return code_block_match.group(1).strip()
 
@@ -84,16 +95,17 @@ def _extract_json_object(text: str) -> str:
     if start == -1:
         raise ValueError("No JSON object found in model output")
 
+    # Only structural characters are visited; the regex engine skips everything else.
     brace_count = 0
     in_string = False
-    escaped = False
-    for idx in range(start, len(text)):
-        char = text[idx]
-        if escaped:
-            escaped = False
+    escaped_pos = -1
+    for match in _JSON_STRUCTURAL_RE.finditer(text, start):
+        idx = match.start()
+        if idx == escaped_pos:
             continue
+        char = text[idx]
         if char == "\\":
-            escaped = True
+            escaped_pos = idx + 1
             continue
         if char == '"':
             in_string = not in_string
@@ -102,7 +114,7 @@ def _extract_json_object(text: str) -> str:
             continue
         if char == "{":
             brace_count += 1
-        elif char == "}":
+        else:
             brace_count -= 1
             if brace_count == 0:
                 return text[start : idx + 1]
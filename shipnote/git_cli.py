@@ -85,9 +85,11 @@ def commit_exists(repo_root: Path, sha: str) -> bool:
 
 
 def commit_in_history(repo_root: Path, sha: str) -> bool:
-    """Return True if commit is reachable from HEAD."""
-    if not commit_exists(repo_root, sha):
-        return False
+    """Return True if commit is reachable from HEAD.
+
+    ``merge-base --is-ancestor`` already fails for unknown or non-commit
+    objects, so no separate existence probe is needed.
+    """
     result = subprocess.run(
         ["git", "merge-base", "--is-ancestor", sha, "HEAD"],
         cwd=repo_root,
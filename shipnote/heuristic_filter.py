@@ -2,21 +2,22 @@
 
 from __future__ import annotations
 
+import os
 import re
-from fnmatch import fnmatch
+from collections.abc import Sequence
 
 from .config_loader import SkipPatternsConfig
 
 
-def _matches_any_message_pattern(message: str, patterns: list[str]) -> str | None:
+def _matches_any_message_pattern(message: str, patterns: Sequence[re.Pattern[str]]) -> str | None:
     for pattern in patterns:
-        if re.search(pattern, message, flags=re.IGNORECASE):
-            return pattern
+        if pattern.search(message):
+            return pattern.pattern
     return None
 
 
-def _matches_any_file_pattern(path: str, patterns: list[str]) -> bool:
-    return any(fnmatch(path, pattern) for pattern in patterns)
+def _matches_any_file_pattern(path: str, pattern: re.Pattern[str] | None) -> bool:
+    return pattern is not None and pattern.match(os.path.normcase(path)) is not None
 
 
 def should_keep_commit(
@@ -25,13 +26,12 @@ def should_keep_commit(
     skip_config: SkipPatternsConfig,
 ) -> tuple[bool, str]:
     """Apply skip heuristics in defined order."""
-    matched_pattern = _matches_any_message_pattern(commit_message, skip_config.messages)
+    matched_pattern = _matches_any_message_pattern(commit_message, skip_config.compiled_messages)
     if matched_pattern is not None:
         return False, f"message matched skip pattern '{matched_pattern}'"
 
-    meaningful_files = [
-        path for path in files_changed if not _matches_any_file_pattern(path, skip_config.files_only)
-    ]
+    files_only = skip_config.compiled_files_only
+    meaningful_files = [path for path in files_changed if not _matches_any_file_pattern(path, files_only)]
     if len(meaningful_files) < skip_config.min_meaningful_files:
         return (
             False,
@@ -16,9 +16,14 @@ from .state_manager import load_state, state_path
 
 
 def _list_markdown_files(path: Path) -> list[Path]:
-    if not path.exists() or not path.is_dir():
+    try:
+        with os.scandir(path) as entries:
+            names = sorted(
+                entry.name for entry in entries if entry.name.endswith(".md") and entry.is_file()
+            )
+    except (FileNotFoundError, NotADirectoryError):
         return []
-    return sorted(path.glob("*.md"))
+    return [path / name for name in names]
 
 
 def _safe_md_filename(name: str) -> str:
@@ -182,6 +187,11 @@ def answer_question(config_path: str, question: str) -> str:
 
 def run_chat(config_path: str) -> int:
     """Interactive operator chat loop."""
+    try:
+        import readline  # noqa: F401  # enables line editing and history for input()
+    except ImportError:
+        pass
+
     try:
         agent = _build_operator_agent(config_path)
         session = agent.session()
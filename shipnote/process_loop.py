@@ -142,7 +142,7 @@ def _run_once_locked(repo_cfg: RepoConfig, *, require_secrets: bool = True) -> i
             git_failed = True
             break
 
-        sanitized_diff, redaction_count = redact_diff(raw_diff, repo_cfg.secret_patterns)
+        sanitized_diff, redaction_count = redact_diff(raw_diff, repo_cfg.compiled_secret_patterns)
         if redaction_count > 0:
             LOGGER.warn(
                 f"Secret scanner redacted {redaction_count} match(es) in commit {commit.sha[:7]}."
@@ -2,33 +2,30 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 from .config_loader import RepoConfig
 
 
-def _csv(values: list[str]) -> str:
+def _csv(values: tuple[str, ...]) -> str:
     return ", ".join(values)
 
 
-def _render_preference_map(values: dict[str, str]) -> str:
-    return "\n".join(f"- {key} -> {value}" for key, value in sorted(values.items()))
+def _render_preference_map(items: tuple[tuple[str, str], ...]) -> str:
+    return "\n".join(f"- {key} -> {value}" for key, value in items)
 
 
-def _render_bool_preference_map(values: dict[str, bool]) -> str:
-    return "\n".join(
-        f"- {key} -> {str(is_eligible).lower()}" for key, is_eligible in sorted(values.items())
-    )
+def _render_bool_preference_map(items: tuple[tuple[str, bool], ...]) -> str:
+    return "\n".join(f"- {key} -> {str(is_eligible).lower()}" for key, is_eligible in items)
 
 
-def build_generation_system_prompt(repo_cfg: RepoConfig) -> str:
-    """Build the generation system prompt from config policy fields."""
-    focus_topics = _csv(repo_cfg.content_policy.focus_topics)
-    avoid_topics = _csv(repo_cfg.content_policy.avoid_topics)
-    category_defaults = _render_preference_map(
-        repo_cfg.template_preferences.content_category_default_by_template
-    )
-    thread_eligibility = _render_bool_preference_map(
-        repo_cfg.template_preferences.is_thread_eligible_by_template
-    )
+@lru_cache(maxsize=4)
+def _build_cached(
+    focus_topics: tuple[str, ...],
+    avoid_topics: tuple[str, ...],
+    category_defaults: tuple[tuple[str, str], ...],
+    thread_eligibility: tuple[tuple[str, bool], ...],
+) -> str:
     return (
         "You are Shipnote, a content generation agent for a developer sharing work publicly on Twitter/X.\n\n"
         "Generate tweet-ready drafts from sanitized commit context.\n\n"
@@ -36,12 +33,27 @@ def build_generation_system_prompt(repo_cfg: RepoConfig) -> str:
         "- Hook -> Context -> Value -> Payoff (punchline at end)\n"
         "- Single tweets must remain under 280 chars\n"
         "- Threads max 7 tweets and first tweet must stand alone\n"
-        f"- Stay inside focus topics: {focus_topics}\n"
-        f"- Never include off-topic content: {avoid_topics}\n"
+        f"- Stay inside focus topics: {_csv(focus_topics)}\n"
+        f"- Never include off-topic content: {_csv(avoid_topics)}\n"
         "- Keep tone technical but accessible, direct, and specific.\n"
         "\nTemplate preferences:\n"
         "content_category_default_by_template:\n"
-        f"{category_defaults}\n"
+        f"{_render_preference_map(category_defaults)}\n"
         "is_thread_eligible_by_template:\n"
-        f"{thread_eligibility}\n"
+        f"{_render_bool_preference_map(thread_eligibility)}\n"
+    )
+
+
+def build_generation_system_prompt(repo_cfg: RepoConfig) -> str:
+    """Build the generation system prompt from config policy fields.
+
+    The prompt only depends on a few config fields, so it is memoized on a
+    hashable fingerprint of them.
+    """
+    preferences = repo_cfg.template_preferences
+    return _build_cached(
+        tuple(repo_cfg.content_policy.focus_topics),
+        tuple(repo_cfg.content_policy.avoid_topics),
+        tuple(sorted(preferences.content_category_default_by_template.items())),
+        tuple(sorted(preferences.is_thread_eligible_by_template.items())),
     )
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-import re
+import os
+from collections import Counter
 from pathlib import Path
 from typing import Any
 
@@ -13,6 +14,12 @@ from .state_manager import utc_now
 AVAILABILITY_REMINDER = "Be available for 60 min after posting. Reply to every reply substantively."
 SPACING_REMINDER = "Space 2-3 hours from last post. Max 2-4 posts/day."
 
+# Byte translation table: keep [a-z0-9], map everything else to "-".
+_SLUG_TABLE = bytes(
+    c if (0x61 <= c <= 0x7A or 0x30 <= c <= 0x39) else 0x2D
+    for c in range(256)
+)
+
 
 def _yaml_quote(value: str) -> str:
     return '"' + value.replace("\\", "\\\\").replace('"', '\\"') + '"'
@@ -20,15 +27,22 @@ def _yaml_quote(value: str) -> str:
 
 def _atomic_write(path: Path, content: str) -> None:
     temp = path.with_suffix(path.suffix + ".tmp")
-    temp.write_text(content, encoding="utf-8")
-    temp.replace(path)
+    data = content.encode("utf-8")
+    fd = os.open(temp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
+    os.replace(temp, path)
 
 
 def _slugify_commit_message(message: str) -> str:
-    slug = re.sub(r"[^a-z0-9]+", "-", message.lower()).strip("-")
-    if len(slug) > 50:
-        slug = slug[:50].rstrip("-")
-    return slug or "commit"
+    # Lowercase before the ASCII pass: some non-ASCII letters (Kelvin sign, dotted I) lower to ASCII.
+    mapped = message.lower().encode("ascii", "replace").translate(_SLUG_TABLE)
+    slug = b"-".join(part for part in mapped.split(b"-") if part)
+    return slug[:50].rstrip(b"-").decode("ascii") or "commit"
 
 
 def _ensure_ledger_shape(state: dict[str, Any]) -> dict[str, Any]:
@@ -93,44 +107,53 @@ def write_drafts(
     queue_dir.mkdir(parents=True, exist_ok=True)
     written_paths: list[Path] = []
     ledger = _ensure_ledger_shape(state)
-
-    for draft in drafts:
-        state["queue_counter"] = int(state.get("queue_counter", 0)) + 1
-        queue_number = int(state["queue_counter"])
-        generated_at = utc_now()
-        date_part = generated_at.split("T", 1)[0]
-        slug = _slugify_commit_message(commit.message)
-        template_type = str(draft.get("template_type", "draft"))
-        filename = f"{queue_number:03d}_{date_part}_{slug}_{template_type}.md"
-        output_path = queue_dir / filename
-
-        frontmatter = _render_frontmatter(
-            queue_number=queue_number,
-            draft=draft,
-            commit=commit,
-            project_name=repo_cfg.project_name,
-            engagement_reminder=repo_cfg.content_policy.engagement_reminder,
-            generated_at=generated_at,
-        )
-        body = str(draft.get("content", "")).strip()
-        markdown = f"{frontmatter}\n\n{body}\n"
-        _atomic_write(output_path, markdown)
-        written_paths.append(output_path)
-
-        ledger["recent_drafts"].append(
-            {
-                "queue_number": queue_number,
-                "commit_sha": commit.sha,
-                "template_type": template_type,
-                "content_category": str(draft.get("content_category", "")),
-                "generated_at": generated_at,
-                "is_thread": bool(draft.get("is_thread", False)),
-            }
-        )
+    records: list[dict[str, Any]] = []
+    category_deltas: Counter[str] = Counter()
+
+    try:
+        for draft in drafts:
+            state["queue_counter"] = int(state.get("queue_counter", 0)) + 1
+            queue_number = int(state["queue_counter"])
+            generated_at = utc_now()
+            date_part = generated_at.split("T", 1)[0]
+            slug = _slugify_commit_message(commit.message)
+            template_type = str(draft.get("template_type", "draft"))
+            filename = f"{queue_number:03d}_{date_part}_{slug}_{template_type}.md"
+            output_path = queue_dir / filename
+
+            frontmatter = _render_frontmatter(
+                queue_number=queue_number,
+                draft=draft,
+                commit=commit,
+                project_name=repo_cfg.project_name,
+                engagement_reminder=repo_cfg.content_policy.engagement_reminder,
+                generated_at=generated_at,
+            )
+            body = str(draft.get("content", "")).strip()
+            markdown = f"{frontmatter}\n\n{body}\n"
+            _atomic_write(output_path, markdown)
+            written_paths.append(output_path)
+
+            records.append(
+                {
+                    "queue_number": queue_number,
+                    "commit_sha": commit.sha,
+                    "template_type": template_type,
+                    "content_category": str(draft.get("content_category", "")),
+                    "generated_at": generated_at,
+                    "is_thread": bool(draft.get("is_thread", False)),
+                }
+            )
+            category_deltas[template_type] += 1
+    finally:
+        # Apply ledger updates once, including drafts written before a failure.
+        ledger["recent_drafts"].extend(records)
         counts = ledger["category_counts_this_week"]
-        if template_type in counts:
-            counts[template_type] = int(counts.get(template_type, 0)) + 1
-        if template_type == "translation":
-            ledger["saveable_this_week"] = int(ledger.get("saveable_this_week", 0)) + 1
+        for template_type, delta in category_deltas.items():
+            if template_type in counts:
+                counts[template_type] = int(counts.get(template_type, 0)) + delta
+        saveable_delta = category_deltas.get("translation", 0)
+        if saveable_delta:
+            ledger["saveable_this_week"] = int(ledger.get("saveable_this_week", 0)) + saveable_delta
 
     return written_paths
@@ -2,23 +2,30 @@
 
 from __future__ import annotations
 
+import io
+import os
 import subprocess
 from dataclasses import dataclass
+from functools import lru_cache
 from importlib import resources
+from operator import attrgetter
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from .config_loader import (
     RepoConfig,
     _deep_merge_dicts,
     _default_repo_config_values,
-    _parse_yaml_subset,
+    _load_optional_global_defaults as _load_global_defaults_file,
     _validate_repo_config,
     default_global_defaults_path,
 )
 from .errors import ShipnoteConfigError
 from .git_cli import ensure_git_repo
 
+if TYPE_CHECKING:
+    from importlib.resources.abc import Traversable
+
 DEFAULT_TEMPLATE_ORDER = [
     "authority",
     "translation",
@@ -27,6 +34,9 @@ DEFAULT_TEMPLATE_ORDER = [
     "thread",
     "weekly_wrapup",
 ]
+_DEFAULT_TEMPLATE_ORDER_SET = frozenset(DEFAULT_TEMPLATE_ORDER)
+
+_BUNDLED_TEMPLATES_CACHE: tuple[tuple[str, bytes], ...] | None = None
 
 
 @dataclass(frozen=True)
@@ -40,100 +50,94 @@ class BootstrapResult:
     git_initialized: bool
 
 
+@lru_cache(maxsize=512)
 def _yaml_quote(text: str) -> str:
-    return '"' + text.replace("\\", "\\\\").replace('"', '\\"') + '"'
+    if "\\" in text or '"' in text:
+        text = text.replace("\\", "\\\\").replace('"', '\\"')
+    return f'"{text}"'
 
 
-def _repo_relative_path(repo_root: Path, value: Path) -> str:
-    return str(value.resolve().relative_to(repo_root.resolve()))
+def _repo_relative_path(resolved_root: Path, value: Path) -> str:
+    return str(value.resolve().relative_to(resolved_root))
 
 
 def _ordered_template_keys(values: dict[str, Any]) -> list[str]:
     ordered = [key for key in DEFAULT_TEMPLATE_ORDER if key in values]
-    extras = sorted([key for key in values.keys() if key not in DEFAULT_TEMPLATE_ORDER])
+    extras = sorted(values.keys() - _DEFAULT_TEMPLATE_ORDER_SET)
     return ordered + extras
 
 
 def _config_yaml_from_repo_config(repo_cfg: RepoConfig) -> str:
     template_categories = repo_cfg.template_preferences.content_category_default_by_template
     thread_eligibility = repo_cfg.template_preferences.is_thread_eligible_by_template
-    lines: list[str] = [
-        f"project_name: {_yaml_quote(repo_cfg.project_name)}",
-        f"project_description: {_yaml_quote(repo_cfg.project_description)}",
-        f"voice_description: {_yaml_quote(repo_cfg.voice_description)}",
-        "",
-        f"poll_interval_seconds: {repo_cfg.poll_interval_seconds}",
-        f"max_drafts_per_commit: {repo_cfg.max_drafts_per_commit}",
-        f"lookback_commits: {repo_cfg.lookback_commits}",
-        "",
-        f'template_dir: "{_repo_relative_path(repo_cfg.repo_root, repo_cfg.template_dir)}"',
-        f'queue_dir: "{_repo_relative_path(repo_cfg.repo_root, repo_cfg.queue_dir)}"',
-        f'archive_dir: "{_repo_relative_path(repo_cfg.repo_root, repo_cfg.archive_dir)}"',
-        "",
-        "context:",
-        "  additional_files:",
-        *[f'    - "{path}"' for path in repo_cfg.context.additional_files],
-        f"  max_total_chars: {repo_cfg.context.max_total_chars}",
-        "",
-        "content_policy:",
-        "  focus_topics:",
-        *[f'    - "{topic}"' for topic in repo_cfg.content_policy.focus_topics],
-        "  avoid_topics:",
-        *[f'    - "{topic}"' for topic in repo_cfg.content_policy.avoid_topics],
-        f"  engagement_reminder: {_yaml_quote(repo_cfg.content_policy.engagement_reminder)}",
-        "",
-        "template_preferences:",
-        "  content_category_default_by_template:",
-    ]
-    lines.extend(
-        [
-            f"    {template}: {_yaml_quote(template_categories[template])}"
-            for template in _ordered_template_keys(template_categories)
-        ]
-    )
-    lines.extend(
-        [
-            "  is_thread_eligible_by_template:",
-            *[
-                f"    {template}: {str(thread_eligibility[template]).lower()}"
-                for template in _ordered_template_keys(thread_eligibility)
-            ],
-            "",
-            "skip_patterns:",
-            "  messages:",
-        ]
-    )
-    lines.extend([f'    - "{pattern}"' for pattern in repo_cfg.skip_patterns.messages])
-    lines.extend(
-        [
-            "  files_only:",
-            *[f'    - "{pattern}"' for pattern in repo_cfg.skip_patterns.files_only],
-            f"  min_meaningful_files: {repo_cfg.skip_patterns.min_meaningful_files}",
-            "",
-            "content_balance:",
-            f"  authority: {repo_cfg.content_balance.authority}",
-            f"  translation: {repo_cfg.content_balance.translation}",
-            f"  personal: {repo_cfg.content_balance.personal}",
-            f"  growth: {repo_cfg.content_balance.growth}",
-            "",
-            "secret_patterns:",
-            *[f'  - "{pattern}"' for pattern in repo_cfg.secret_patterns],
-            "",
-        ]
-    )
-    return "\n".join(lines)
+    resolved_root = repo_cfg.repo_root.resolve()
+    buf = io.StringIO()
+    w = buf.write
+
+    w(f"project_name: {_yaml_quote(repo_cfg.project_name)}\n")
+    w(f"project_description: {_yaml_quote(repo_cfg.project_description)}\n")
+    w(f"voice_description: {_yaml_quote(repo_cfg.voice_description)}\n")
+    w("\n")
+    w(f"poll_interval_seconds: {repo_cfg.poll_interval_seconds}\n")
+    w(f"max_drafts_per_commit: {repo_cfg.max_drafts_per_commit}\n")
+    w(f"lookback_commits: {repo_cfg.lookback_commits}\n")
+    w("\n")
+    w(f'template_dir: "{_repo_relative_path(resolved_root, repo_cfg.template_dir)}"\n')
+    w(f'queue_dir: "{_repo_relative_path(resolved_root, repo_cfg.queue_dir)}"\n')
+    w(f'archive_dir: "{_repo_relative_path(resolved_root, repo_cfg.archive_dir)}"\n')
+    w("\n")
+
+    w("context:\n")
+    w("  additional_files:\n")
+    for path in repo_cfg.context.additional_files:
+        w(f'    - "{path}"\n')
+    w(f"  max_total_chars: {repo_cfg.context.max_total_chars}\n")
+    w("\n")
+
+    w("content_policy:\n")
+    w("  focus_topics:\n")
+    for topic in repo_cfg.content_policy.focus_topics:
+        w(f'    - "{topic}"\n')
+    w("  avoid_topics:\n")
+    for topic in repo_cfg.content_policy.avoid_topics:
+        w(f'    - "{topic}"\n')
+    w(f"  engagement_reminder: {_yaml_quote(repo_cfg.content_policy.engagement_reminder)}\n")
+    w("\n")
+
+    w("template_preferences:\n")
+    w("  content_category_default_by_template:\n")
+    for template in _ordered_template_keys(template_categories):
+        w(f"    {template}: {_yaml_quote(template_categories[template])}\n")
+    w("  is_thread_eligible_by_template:\n")
+    for template in _ordered_template_keys(thread_eligibility):
+        w(f"    {template}: {str(thread_eligibility[template]).lower()}\n")
+    w("\n")
+
+    w("skip_patterns:\n")
+    w("  messages:\n")
+    for pattern in repo_cfg.skip_patterns.messages:
+        w(f'    - "{pattern}"\n')
+    w("  files_only:\n")
+    for pattern in repo_cfg.skip_patterns.files_only:
+        w(f'    - "{pattern}"\n')
+    w(f"  min_meaningful_files: {repo_cfg.skip_patterns.min_meaningful_files}\n")
+    w("\n")
+
+    w("content_balance:\n")
+    w(f"  authority: {repo_cfg.content_balance.authority}\n")
+    w(f"  translation: {repo_cfg.content_balance.translation}\n")
+    w(f"  personal: {repo_cfg.content_balance.personal}\n")
+    w(f"  growth: {repo_cfg.content_balance.growth}\n")
+    w("\n")
+
+    w("secret_patterns:\n")
+    for pattern in repo_cfg.secret_patterns:
+        w(f'  - "{pattern}"\n')
+    return buf.getvalue()
 
 
 def _load_optional_global_defaults() -> dict[str, Any]:
-    defaults_path = default_global_defaults_path()
-    if not defaults_path.exists():
-        return {}
-    if not defaults_path.is_file():
-        raise ShipnoteConfigError(f"Global defaults path is not a file: {defaults_path}")
-    parsed = _parse_yaml_subset(defaults_path)
-    if not isinstance(parsed, dict):
-        raise ShipnoteConfigError(f"Global defaults root must be an object: {defaults_path}")
-    return parsed
+    return _load_global_defaults_file(default_global_defaults_path())
 
 
 def _resolve_config_path(repo: Path, config_path_override: str | Path | None) -> Path:
@@ -152,6 +156,8 @@ def _resolve_config_path(repo: Path, config_path_override: str | Path | None) ->
 
 
 def _ensure_git_repo(repo_path: Path, *, init_git: bool) -> bool:
+    if (repo_path / ".git").is_dir():
+        return False
     try:
         ensure_git_repo(repo_path)
         return False
@@ -161,35 +167,77 @@ def _ensure_git_repo(repo_path: Path, *, init_git: bool) -> bool:
                 f"Target path is not a git repository: {repo_path}. "
                 "Run `git init` or pass --init-git."
             )
-        result = subprocess.run(
-            ["git", "init", "-q"],
-            cwd=repo_path,
-            capture_output=True,
-            text=True,
-            check=False,
-        )
+        try:
+            result = subprocess.run(
+                ["git", "init", "-q"],
+                cwd=repo_path,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                check=False,
+            )
+        except OSError as exc:
+            raise ShipnoteConfigError(
+                f"Failed to initialize git repository at {repo_path}: {exc}"
+            ) from exc
         if result.returncode != 0:
+            stderr = result.stderr.decode("utf-8", errors="replace").strip()
             raise ShipnoteConfigError(
                 f"Failed to initialize git repository at {repo_path}: "
-                f"{result.stderr.strip() or 'unknown error'}"
+                f"{stderr or 'unknown error'}"
             )
         return True
 
 
+def _ensure_dirs(*dirs: Path) -> None:
+    seen: set[Path] = set()
+    for directory in dirs:
+        if directory in seen:
+            continue
+        seen.add(directory)
+        if not directory.is_dir():
+            directory.mkdir(parents=True, exist_ok=True)
+
+
 def _write_text_atomic(path: Path, content: str) -> None:
-    temp = path.with_suffix(path.suffix + ".tmp")
+    temp = path.with_name(path.name + ".tmp")
     temp.write_text(content, encoding="utf-8")
     temp.replace(path)
 
 
-def _bundled_template_paths() -> list[resources.abc.Traversable]:
-    root = resources.files("shipnote.assets.templates")
+def _write_bytes_atomic(path: Path, data: bytes) -> None:
+    temp = path.with_name(path.name + ".tmp")
+    temp.write_bytes(data)
+    temp.replace(path)
+
+
+@lru_cache(maxsize=1)
+def _templates_root() -> Traversable:
+    return resources.files("shipnote.assets.templates")
+
+
+def _bundled_template_paths() -> list[Traversable]:
+    root = _templates_root()
+    if isinstance(root, Path):
+        # Filesystem-backed install: scan directly instead of via Traversable.
+        with os.scandir(root) as entries:
+            names = sorted(entry.name for entry in entries if entry.name.endswith(".md"))
+        return [root / name for name in names]
     return sorted(
         [item for item in root.iterdir() if item.name.endswith(".md")],
-        key=lambda item: item.name,
+        key=attrgetter("name"),
     )
 
 
+def _get_bundled_templates() -> tuple[tuple[str, bytes], ...]:
+    """Return bundled template ``(filename, content)`` pairs, read once per process."""
+    global _BUNDLED_TEMPLATES_CACHE
+    if _BUNDLED_TEMPLATES_CACHE is None:
+        _BUNDLED_TEMPLATES_CACHE = tuple(
+            (item.name, item.read_bytes()) for item in _bundled_template_paths()
+        )
+    return _BUNDLED_TEMPLATES_CACHE
+
+
 def bootstrap_repo(
     *,
     repo_path: Path,
@@ -226,30 +274,31 @@ def bootstrap_repo(
         raw_values["poll_interval_seconds"] = max(1, poll_interval_seconds)
 
     resolved_cfg = _validate_repo_config(raw_values, repo, config_path)
-    config_content = _config_yaml_from_repo_config(resolved_cfg)
 
-    resolved_cfg.shipnote_dir.mkdir(parents=True, exist_ok=True)
-    resolved_cfg.template_dir.mkdir(parents=True, exist_ok=True)
-    resolved_cfg.queue_dir.mkdir(parents=True, exist_ok=True)
-    resolved_cfg.archive_dir.mkdir(parents=True, exist_ok=True)
-    config_path.parent.mkdir(parents=True, exist_ok=True)
+    _ensure_dirs(
+        resolved_cfg.shipnote_dir,
+        resolved_cfg.template_dir,
+        resolved_cfg.queue_dir,
+        resolved_cfg.archive_dir,
+        config_path.parent,
+    )
 
     created_config = False
     updated_config = False
     if config_path.exists():
         if force:
-            _write_text_atomic(config_path, config_content)
+            _write_text_atomic(config_path, _config_yaml_from_repo_config(resolved_cfg))
             updated_config = True
     else:
-        _write_text_atomic(config_path, config_content)
+        _write_text_atomic(config_path, _config_yaml_from_repo_config(resolved_cfg))
         created_config = True
 
     written_count = 0
-    for bundled in _bundled_template_paths():
-        target = resolved_cfg.template_dir / bundled.name
+    for name, data in _get_bundled_templates():
+        target = resolved_cfg.template_dir / name
         if target.exists() and not force:
             continue
-        _write_text_atomic(target, bundled.read_text(encoding="utf-8"))
+        _write_bytes_atomic(target, data)
         written_count += 1
 
     return BootstrapResult(
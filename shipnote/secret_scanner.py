@@ -3,11 +3,15 @@
 from __future__ import annotations
 
 import re
+from collections.abc import Sequence
 
 REDACTION_TOKEN = "[REDACTED]"
 
 
-def redact_diff(diff_text: str, secret_patterns: list[str] | None = None) -> tuple[str, int]:
+def redact_diff(
+    diff_text: str,
+    secret_patterns: Sequence[str | re.Pattern[str]] | None = None,
+) -> tuple[str, int]:
     """Redact secret-like content using configured regex patterns."""
     patterns = secret_patterns or []
     sanitized = diff_text
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import re
+from collections import OrderedDict
+from dataclasses import dataclass, replace
 from pathlib import Path
 from typing import Any
 
@@ -16,6 +18,13 @@ STANDARD_TEMPLATE_FILES = (
     "thread.md",
     "weekly_wrapup.md",
 )
+_STANDARD_TEMPLATE_FILES_SET: frozenset[str] = frozenset(STANDARD_TEMPLATE_FILES)
+_FRONTMATTER_CLOSE_RE = re.compile(r"^[^\S\n]*---[^\S\n]*$", re.MULTILINE)
+_TEMPLATE_CACHE_SIZE = 8
+# Resolved template dir -> (per-file stat fingerprints, parsed templates); least recently used first.
+_TEMPLATE_CACHE: OrderedDict[
+    Path, tuple[tuple[tuple[str, int, int, int], ...], dict[str, TemplateDocument]]
+] = OrderedDict()
 
 
 @dataclass(frozen=True)
@@ -30,22 +39,24 @@ class TemplateDocument:
 
 
 def _parse_frontmatter(raw: str, filename: str) -> tuple[dict[str, Any], str]:
-    lines = raw.splitlines()
-    if not lines or lines[0].strip() != "---":
+    first_end = raw.find("\n")
+    first_line = raw if first_end == -1 else raw[:first_end]
+    if first_line.strip() != "---":
         raise ShipnoteConfigError(f"Template '{filename}' is missing YAML frontmatter.")
 
-    end_idx = None
-    for idx in range(1, len(lines)):
-        if lines[idx].strip() == "---":
-            end_idx = idx
-            break
-    if end_idx is None:
+    closing = _FRONTMATTER_CLOSE_RE.search(raw, first_end + 1) if first_end != -1 else None
+    if closing is None:
         raise ShipnoteConfigError(f"Template '{filename}' has unclosed YAML frontmatter.")
 
-    frontmatter_lines = lines[1:end_idx]
-    body = "\n".join(lines[end_idx + 1 :]).lstrip("\n")
+    frontmatter_text = raw[first_end + 1 : closing.start()]
+    body = raw[closing.end() + 1 :]
+    if "\r" in body:
+        body = "\n".join(body.splitlines())
+    elif body.endswith("\n"):
+        body = body[:-1]
+    body = body.lstrip("\n")
     frontmatter: dict[str, Any] = {}
-    for line in frontmatter_lines:
+    for line in frontmatter_text.splitlines():
         stripped = line.strip()
         if not stripped or stripped.startswith("#"):
             continue
@@ -62,15 +73,40 @@ def _parse_frontmatter(raw: str, filename: str) -> tuple[dict[str, Any], str]:
     return frontmatter, body
 
 
+def _template_fingerprint(path: Path) -> tuple[str, int, int, int]:
+    stat = path.stat()
+    return path.name, stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+
+def _copy_templates(templates: dict[str, TemplateDocument]) -> dict[str, TemplateDocument]:
+    # Frontmatter values are flat strings, so a shallow dict copy fully detaches the cache.
+    return {
+        name: replace(template, frontmatter=dict(template.frontmatter))
+        for name, template in templates.items()
+    }
+
+
 def load_templates(template_dir: Path) -> dict[str, TemplateDocument]:
-    """Load all markdown templates from a directory."""
+    """Load all markdown templates from a directory.
+
+    Parsed templates are cached per resolved directory (the few most recently
+    used ones) and reused while every file's mtime, size and inode are unchanged.
+    Callers get their own copies and may mutate them freely.
+    """
     if not template_dir.exists() or not template_dir.is_dir():
         raise ShipnoteConfigError(f"Template directory not found: {template_dir}")
 
+    template_dir = template_dir.resolve()
     paths = sorted(template_dir.glob("*.md"))
     if not paths:
         raise ShipnoteConfigError(f"Template directory is empty: {template_dir}")
 
+    fingerprint = tuple(_template_fingerprint(path) for path in paths)
+    cached = _TEMPLATE_CACHE.get(template_dir)
+    if cached is not None and cached[0] == fingerprint:
+        _TEMPLATE_CACHE.move_to_end(template_dir)
+        return _copy_templates(cached[1])
+
     templates: dict[str, TemplateDocument] = {}
     for path in paths:
         raw = path.read_text(encoding="utf-8")
@@ -82,11 +118,22 @@ def load_templates(template_dir: Path) -> dict[str, TemplateDocument]:
             body=body,
             raw=raw,
         )
-    return templates
+    _TEMPLATE_CACHE[template_dir] = (fingerprint, templates)
+    _TEMPLATE_CACHE.move_to_end(template_dir)
+    while len(_TEMPLATE_CACHE) > _TEMPLATE_CACHE_SIZE:
+        _TEMPLATE_CACHE.popitem(last=False)
+    return _copy_templates(templates)
+
+
+def clear_template_cache() -> None:
+    """Drop all cached template directories."""
+    _TEMPLATE_CACHE.clear()
 
 
 def missing_standard_templates(templates: dict[str, TemplateDocument]) -> list[str]:
     """Return standard template filenames that are not present."""
-    present = set(templates.keys())
-    return [name for name in STANDARD_TEMPLATE_FILES if name not in present]
+    missing = _STANDARD_TEMPLATE_FILES_SET - templates.keys()
+    if not missing:
+        return []
+    return [name for name in STANDARD_TEMPLATE_FILES if name in missing]
 
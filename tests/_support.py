@@ -0,0 +1,99 @@
+"""Shared builders for the unittest suite (not collected: no ``test_`` prefix)."""
+
+from __future__ import annotations
+
+import atexit
+import os
+import shutil
+import subprocess
+import tempfile
+import unittest
+from pathlib import Path
+from typing import Any
+
+from shipnote.config_loader import (
+    ContentBalanceConfig,
+    ContentPolicyConfig,
+    ContextConfig,
+    RepoConfig,
+    SkipPatternsConfig,
+)
+
+
+GIT = shutil.which("git") or "git"
+# Minimal environment for fixture-only git calls: ignores user and system git config.
+GIT_ENV = {
+    "GIT_CONFIG_GLOBAL": os.devnull,
+    "GIT_CONFIG_SYSTEM": os.devnull,
+    "PATH": os.environ.get("PATH", os.defpath),
+}
+
+SKIP_SLOW_ENV = "SHIPNOTE_SKIP_SLOW_TESTS"
+
+# Marks tests dominated by real git subprocesses; set SHIPNOTE_SKIP_SLOW_TESTS=1 to skip them.
+slow = unittest.skipIf(os.environ.get(SKIP_SLOW_ENV) == "1", f"{SKIP_SLOW_ENV}=1")
+
+
+def run_git(repo: Path, args: list[str]) -> None:
+    subprocess.run([GIT, *args], cwd=repo, env=GIT_ENV, check=True, capture_output=True, text=True)
+
+
+def make_repo_config(root: Path, **overrides: Any) -> RepoConfig:
+    """Build a RepoConfig rooted at ``root``; keyword arguments replace individual fields."""
+    shipnote_dir = root / ".shipnote"
+    fields: dict[str, Any] = {
+        "config_path": shipnote_dir / "config.yaml",
+        "repo_root": root,
+        "shipnote_dir": shipnote_dir,
+        "project_name": "Test",
+        "project_description": "Test project",
+        "voice_description": "Direct",
+        "poll_interval_seconds": 60,
+        "max_drafts_per_commit": 3,
+        "lookback_commits": 10,
+        "template_dir": shipnote_dir / "templates",
+        "queue_dir": shipnote_dir / "queue",
+        "archive_dir": shipnote_dir / "archive",
+        "skip_patterns": SkipPatternsConfig(messages=[], files_only=[], min_meaningful_files=1),
+        "content_balance": ContentBalanceConfig(authority=30, translation=25, personal=25, growth=20),
+        "secret_patterns": [],
+        "raw_config": {},
+        "context": ContextConfig(additional_files=[".shipnote/context.md"], max_total_chars=12000),
+        "content_policy": ContentPolicyConfig(
+            focus_topics=["software engineering"],
+            avoid_topics=["politics", "sports", "crypto"],
+            engagement_reminder="Engage in relevant community discussions before and after posting.",
+        ),
+    }
+    fields.update(overrides)
+    return RepoConfig(**fields)
+
+
+class TempRootTestCase(unittest.TestCase):
+    """Give each test a fresh ``self.root`` under one per-class temp dir that is removed at exit."""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls._tmp = tempfile.mkdtemp()
+        atexit.register(shutil.rmtree, cls._tmp, ignore_errors=True)
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.root = Path(tempfile.mkdtemp(dir=self._tmp))
+
+
+class GitTemplateRepoTestCase(TempRootTestCase):
+    """TempRootTestCase that runs ``git init`` once per class and copies the result per test."""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls._template_repo = Path(cls._tmp) / "template-repo"
+        cls._template_repo.mkdir()
+        run_git(cls._template_repo, ["init", "-q"])
+
+    def _copy_template_repo(self, root: Path) -> Path:
+        repo = root / "repo"
+        shutil.copytree(self._template_repo, repo)
+        return repo
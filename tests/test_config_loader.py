@@ -1,23 +1,36 @@
 from __future__ import annotations
 
 import os
-import subprocess
-import tempfile
 import unittest
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
 from unittest.mock import patch
 
+from tests._support import TempRootTestCase
+from shipnote import config_loader
 from shipnote.config_loader import (
     AXIS_MODEL_KEY,
+    _load_optional_global_defaults,
+    _parse_env_file,
+    clear_repo_config_cache,
     default_global_defaults_path,
     load_repo_config,
+    load_repo_config_from_text,
     load_secrets,
 )
 from shipnote.errors import ShipnoteConfigError, ShipnoteSecretsError
 
 
-def _run(repo: Path, args: list[str]) -> None:
-    subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True, text=True)
+@contextmanager
+def set_attr(obj: object, name: str, value: object) -> Iterator[None]:
+    """Temporarily replace one attribute; a lighter stand-in for ``mock.patch``."""
+    old = getattr(obj, name)
+    setattr(obj, name, value)
+    try:
+        yield
+    finally:
+        setattr(obj, name, old)
 
 
 def _write_config(repo: Path, body: str) -> Path:
@@ -28,8 +41,7 @@ def _write_config(repo: Path, body: str) -> Path:
     return path
 
 
-def _base_config_text() -> str:
-    return """
+_BASE_CONFIG_TEXT = """
 project_name: "Demo"
 project_description: "Demo description"
 voice_description: "Direct and technical"
@@ -73,144 +85,185 @@ content_balance:
 secret_patterns:
   - "(sk-[a-zA-Z0-9]{20,})"
 """.strip()
+_BASE_CONFIG_ZERO_MAX_CHARS = _BASE_CONFIG_TEXT.replace("max_total_chars: 12000", "max_total_chars: 0")
+_BASE_CONFIG_EMPTY_FOCUS = _BASE_CONFIG_TEXT.replace(
+    'focus_topics:\n    - "software engineering"\n    - "developer tooling"',
+    "focus_topics: []",
+)
+_BASE_CONFIG_WITHOUT_QUEUE_DIR = _BASE_CONFIG_TEXT.replace('queue_dir: ".shipnote/queue"\n', "")
 
 
-class ConfigLoaderTests(unittest.TestCase):
+class ConfigLoaderTests(TempRootTestCase):
     def test_load_repo_config_parses_context_and_content_policy(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp:
-            repo = Path(tmp) / "repo"
-            repo.mkdir(parents=True, exist_ok=True)
-            _run(repo, ["init", "-q"])
-            cfg = _write_config(repo, _base_config_text())
+        loaded = load_repo_config_from_text(_BASE_CONFIG_TEXT, repo_root=self.root)
 
-            loaded = load_repo_config(str(cfg))
+        self.assertEqual(loaded.context.additional_files, [".shipnote/context.md", ".shipnote/notes.txt"])
+        self.assertEqual(loaded.context.max_total_chars, 12000)
+        self.assertEqual(loaded.content_policy.focus_topics, ["software engineering", "developer tooling"])
+        self.assertEqual(loaded.content_policy.avoid_topics, ["politics", "sports"])
+        self.assertIn("community discussions", loaded.content_policy.engagement_reminder)
 
-            self.assertEqual(loaded.context.additional_files, [".shipnote/context.md", ".shipnote/notes.txt"])
-            self.assertEqual(loaded.context.max_total_chars, 12000)
-            self.assertEqual(loaded.content_policy.focus_topics, ["software engineering", "developer tooling"])
-            self.assertEqual(loaded.content_policy.avoid_topics, ["politics", "sports"])
-            self.assertIn("community discussions", loaded.content_policy.engagement_reminder)
+    def test_load_repo_config_from_text_matches_file_based_load(self) -> None:
+        cfg = _write_config(self.root, _BASE_CONFIG_TEXT)
 
-    def test_load_repo_config_rejects_invalid_context_max_total_chars(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp:
-            repo = Path(tmp) / "repo"
-            repo.mkdir(parents=True, exist_ok=True)
-            _run(repo, ["init", "-q"])
-            cfg = _write_config(repo, _base_config_text().replace("max_total_chars: 12000", "max_total_chars: 0"))
+        self.assertEqual(
+            load_repo_config_from_text(_BASE_CONFIG_TEXT, repo_root=self.root),
+            load_repo_config(str(cfg)),
+        )
 
-            with self.assertRaises(ShipnoteConfigError):
-                load_repo_config(str(cfg))
+    def test_load_repo_config_rejects_invalid_context_max_total_chars(self) -> None:
+        with self.assertRaises(ShipnoteConfigError):
+            load_repo_config_from_text(_BASE_CONFIG_ZERO_MAX_CHARS, repo_root=self.root)
 
     def test_load_repo_config_rejects_empty_focus_topics(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp:
-            repo = Path(tmp) / "repo"
-            repo.mkdir(parents=True, exist_ok=True)
-            _run(repo, ["init", "-q"])
-            cfg = _write_config(
-                repo,
-                _base_config_text().replace(
-                    'focus_topics:\n    - "software engineering"\n    - "developer tooling"',
-                    "focus_topics: []",
-                ),
-            )
-
-            with self.assertRaises(ShipnoteConfigError):
-                load_repo_config(str(cfg))
+        with self.assertRaises(ShipnoteConfigError):
+            load_repo_config_from_text(_BASE_CONFIG_EMPTY_FOCUS, repo_root=self.root)
 
     def test_load_repo_config_uses_global_defaults_and_repo_precedence(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp:
-            root = Path(tmp)
-            repo = root / "repo"
-            repo.mkdir(parents=True, exist_ok=True)
-            _run(repo, ["init", "-q"])
-
-            repo_cfg_text = _base_config_text().replace('queue_dir: ".shipnote/queue"\n', "")
-            repo_cfg_text = repo_cfg_text.replace("poll_interval_seconds: 60", "poll_interval_seconds: 45")
-            cfg = _write_config(repo, repo_cfg_text)
-
-            global_defaults = root / "defaults.yaml"
-            global_defaults.write_text(
-                "\n".join(
-                    [
-                        'queue_dir: ".shipnote/global-drafts"',
-                        "poll_interval_seconds: 120",
-                    ]
-                )
-                + "\n",
-                encoding="utf-8",
-            )
+        root = self.root
+        repo = root / "repo"
+
+        repo_cfg_text = _BASE_CONFIG_WITHOUT_QUEUE_DIR.replace("poll_interval_seconds: 60", "poll_interval_seconds: 45")
+        cfg = _write_config(repo, repo_cfg_text)
 
-            with patch("shipnote.config_loader.default_global_defaults_path", return_value=global_defaults):
-                loaded = load_repo_config(str(cfg))
+        global_defaults = root / "defaults.yaml"
+        global_defaults.write_text(
+            "\n".join(
+                [
+                    'queue_dir: ".shipnote/global-drafts"',
+                    "poll_interval_seconds: 120",
+                ]
+            )
+            + "\n",
+            encoding="utf-8",
+        )
 
-            self.assertEqual(loaded.poll_interval_seconds, 45)
-            self.assertEqual(loaded.queue_dir, (repo / ".shipnote/global-drafts").resolve())
+        with set_attr(config_loader, "default_global_defaults_path", lambda: global_defaults):
+            loaded = load_repo_config(str(cfg))
 
-    def test_load_repo_config_uses_builtin_queue_dir_when_missing_everywhere(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp:
-            root = Path(tmp)
-            repo = root / "repo"
-            repo.mkdir(parents=True, exist_ok=True)
-            _run(repo, ["init", "-q"])
+        self.assertEqual(loaded.poll_interval_seconds, 45)
+        self.assertEqual(loaded.queue_dir, (repo / ".shipnote/global-drafts").resolve())
 
-            repo_cfg_text = _base_config_text().replace('queue_dir: ".shipnote/queue"\n', "")
-            cfg = _write_config(repo, repo_cfg_text)
-            missing_defaults_path = root / "missing-defaults.yaml"
-            self.assertFalse(missing_defaults_path.exists())
+    def test_load_repo_config_reuses_cache_until_config_or_defaults_change(self) -> None:
+        root = self.root
+        repo = root / "repo"
+        repo.mkdir(parents=True, exist_ok=True)
+        cfg = _write_config(repo, _BASE_CONFIG_WITHOUT_QUEUE_DIR)
+        global_defaults = root / "defaults.yaml"
 
-            with patch("shipnote.config_loader.default_global_defaults_path", return_value=missing_defaults_path):
-                loaded = load_repo_config(str(cfg))
+        with set_attr(config_loader, "default_global_defaults_path", lambda: global_defaults):
+            first = load_repo_config(str(cfg))
+            with patch.object(config_loader, "_parse_yaml_subset", side_effect=AssertionError("parsed")):
+                self.assertEqual(load_repo_config(str(cfg)), first)
 
-            self.assertEqual(loaded.queue_dir, (repo / ".shipnote/drafts").resolve())
+            global_defaults.write_text('queue_dir: ".shipnote/global-drafts"\n', encoding="utf-8")
+            with_defaults = load_repo_config(str(cfg))
+            self.assertEqual(with_defaults.queue_dir, (repo / ".shipnote/global-drafts").resolve())
 
-    def test_load_repo_config_parses_template_preferences(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp:
-            repo = Path(tmp) / "repo"
-            repo.mkdir(parents=True, exist_ok=True)
-            _run(repo, ["init", "-q"])
-            cfg = _write_config(
+            # The fingerprint is (mtime_ns, size, inode); change the size so the edit is
+            # seen even when it lands within the same mtime tick as the first write.
+            _write_config(
                 repo,
-                _base_config_text()
-                + "\n\n"
-                + "\n".join(
-                    [
-                        "template_preferences:",
-                        "  content_category_default_by_template:",
-                        '    authority: "cross-group"',
-                        "  is_thread_eligible_by_template:",
-                        "    authority: true",
-                    ]
-                ),
+                _BASE_CONFIG_WITHOUT_QUEUE_DIR.replace("poll_interval_seconds: 60", "poll_interval_seconds: 120"),
             )
+            self.assertEqual(load_repo_config(str(cfg)).poll_interval_seconds, 120)
+
+    def test_mutating_a_loaded_config_does_not_leak_into_later_loads(self) -> None:
+        cfg = _write_config(self.root, _BASE_CONFIG_TEXT)
+        missing_defaults = self.root / "missing-defaults.yaml"
+
+        with set_attr(config_loader, "default_global_defaults_path", lambda: missing_defaults):
+            first = load_repo_config(str(cfg))
+            first.raw_config["project_name"] = "Mutated"
+            first.skip_patterns.messages.append("^mutated")
+            first.context.additional_files.clear()
+            first.content_policy.focus_topics.append("mutated")
+            first.secret_patterns.append("mutated")
+            first.template_preferences.is_thread_eligible_by_template["authority"] = False
+            second = load_repo_config(str(cfg))
+
+        self.assertEqual(second.raw_config["project_name"], "Demo")
+        self.assertEqual(second.skip_patterns.messages, ["^wip"])
+        self.assertEqual(second, load_repo_config_from_text(_BASE_CONFIG_TEXT, repo_root=self.root))
+
+    def test_load_repo_config_without_cache_leaves_cache_empty(self) -> None:
+        cfg = _write_config(self.root, _BASE_CONFIG_TEXT)
+        missing_defaults = self.root / "missing-defaults.yaml"
+
+        with set_attr(config_loader, "default_global_defaults_path", lambda: missing_defaults):
+            clear_repo_config_cache()
+            loaded = load_repo_config(str(cfg), cache=False)
+
+        self.assertEqual(loaded.poll_interval_seconds, 60)
+        self.assertEqual(config_loader._load_repo_config_cached.cache_info().currsize, 0)
+        self.assertEqual(list(cfg.parent.iterdir()), [cfg])
+
+    def test_global_defaults_cache_hands_out_copies_and_tracks_changes(self) -> None:
+        path = self.root / "defaults.yaml"
+        self.assertEqual(_load_optional_global_defaults(path), {})
+
+        path.write_text("content_policy:\n  focus_topics:\n    - \"rust\"\n", encoding="utf-8")
+        first = _load_optional_global_defaults(path)
+        first["content_policy"]["focus_topics"].append("mutated")
+        self.assertEqual(
+            _load_optional_global_defaults(path),
+            {"content_policy": {"focus_topics": ["rust"]}},
+        )
+
+        path.write_text("poll_interval_seconds: 30\n", encoding="utf-8")
+        self.assertEqual(_load_optional_global_defaults(path), {"poll_interval_seconds": 30})
 
+    def test_load_repo_config_uses_builtin_queue_dir_when_missing_everywhere(self) -> None:
+        root = self.root
+        repo = root / "repo"
+
+        cfg = _write_config(repo, _BASE_CONFIG_WITHOUT_QUEUE_DIR)
+        missing_defaults_path = root / "missing-defaults.yaml"
+        self.assertFalse(missing_defaults_path.exists())
+
+        with set_attr(config_loader, "default_global_defaults_path", lambda: missing_defaults_path):
             loaded = load_repo_config(str(cfg))
 
-            self.assertEqual(
-                loaded.template_preferences.content_category_default_by_template["authority"],
-                "cross-group",
+        self.assertEqual(loaded.queue_dir, (repo / ".shipnote/drafts").resolve())
+
+    def test_load_repo_config_parses_template_preferences(self) -> None:
+        text = (
+            _BASE_CONFIG_TEXT
+            + "\n\n"
+            + "\n".join(
+                [
+                    "template_preferences:",
+                    "  content_category_default_by_template:",
+                    '    authority: "cross-group"',
+                    "  is_thread_eligible_by_template:",
+                    "    authority: true",
+                ]
             )
-            self.assertTrue(loaded.template_preferences.is_thread_eligible_by_template["authority"])
+        )
+
+        loaded = load_repo_config_from_text(text, repo_root=self.root)
+
+        self.assertEqual(
+            loaded.template_preferences.content_category_default_by_template["authority"],
+            "cross-group",
+        )
+        self.assertTrue(loaded.template_preferences.is_thread_eligible_by_template["authority"])
 
     def test_load_repo_config_rejects_non_boolean_thread_eligibility_preference(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp:
-            repo = Path(tmp) / "repo"
-            repo.mkdir(parents=True, exist_ok=True)
-            _run(repo, ["init", "-q"])
-            cfg = _write_config(
-                repo,
-                _base_config_text()
-                + "\n\n"
-                + "\n".join(
-                    [
-                        "template_preferences:",
-                        "  is_thread_eligible_by_template:",
-                        '    authority: "yes"',
-                    ]
-                ),
+        text = (
+            _BASE_CONFIG_TEXT
+            + "\n\n"
+            + "\n".join(
+                [
+                    "template_preferences:",
+                    "  is_thread_eligible_by_template:",
+                    '    authority: "yes"',
+                ]
             )
+        )
 
-            with self.assertRaises(ShipnoteConfigError):
-                load_repo_config(str(cfg))
+        with self.assertRaises(ShipnoteConfigError):
+            load_repo_config_from_text(text, repo_root=self.root)
 
     def test_default_global_defaults_path_points_to_home_dot_shipnote(self) -> None:
         path = default_global_defaults_path()
@@ -224,103 +277,119 @@ def _write_secrets(path: Path, lines: list[str]) -> None:
     path.chmod(0o600)
 
 
-class SecretsAliasTests(unittest.TestCase):
+class SecretsAliasTests(TempRootTestCase):
+    def test_parse_env_file_handles_comments_quotes_and_blank_lines(self) -> None:
+        path = self.root / "secrets.env"
+        _write_secrets(
+            path,
+            [
+                "# comment line",
+                "",
+                "OPENAI_API_KEY = sk-test # trailing comment",
+                'SHIPNOTE_MODEL="model # not a comment"',
+                "SHIPNOTE_PROVIDER='anthropic'",
+                "=missing-key",
+                "NO_EQUALS_SIGN",
+            ],
+        )
+
+        self.assertEqual(
+            _parse_env_file(path),
+            {
+                "OPENAI_API_KEY": "sk-test",
+                "SHIPNOTE_MODEL": "model # not a comment",
+                "SHIPNOTE_PROVIDER": "anthropic",
+            },
+        )
+
     def test_shipnote_model_env_maps_to_axis_model(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp:
-            secrets_path = Path(tmp) / "secrets.env"
-            _write_secrets(secrets_path, ["OPENAI_API_KEY=file-key"])
-            with patch("shipnote.config_loader.default_secrets_path", return_value=secrets_path):
-                with patch.dict(os.environ, {"SHIPNOTE_MODEL": "model-from-shipnote"}, clear=True):
-                    load_secrets(required=True)
-                    self.assertEqual(os.getenv(AXIS_MODEL_KEY), "model-from-shipnote")
+        secrets_path = self.root / "secrets.env"
+        _write_secrets(secrets_path, ["OPENAI_API_KEY=file-key"])
+        with set_attr(config_loader, "default_secrets_path", lambda: secrets_path):
+            with patch.dict(os.environ, {"SHIPNOTE_MODEL": "model-from-shipnote"}, clear=True):
+                load_secrets(required=True)
+                self.assertEqual(os.getenv(AXIS_MODEL_KEY), "model-from-shipnote")
 
     def test_axis_model_env_takes_precedence_over_shipnote_model(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp:
-            secrets_path = Path(tmp) / "secrets.env"
-            _write_secrets(secrets_path, ["OPENAI_API_KEY=file-key"])
-            with patch("shipnote.config_loader.default_secrets_path", return_value=secrets_path):
-                with patch.dict(
-                    os.environ,
-                    {AXIS_MODEL_KEY: "axis-model", "SHIPNOTE_MODEL": "shipnote-model"},
-                    clear=True,
-                ):
-                    load_secrets(required=True)
-                    self.assertEqual(os.getenv(AXIS_MODEL_KEY), "axis-model")
+        secrets_path = self.root / "secrets.env"
+        _write_secrets(secrets_path, ["OPENAI_API_KEY=file-key"])
+        with set_attr(config_loader, "default_secrets_path", lambda: secrets_path):
+            with patch.dict(
+                os.environ,
+                {AXIS_MODEL_KEY: "axis-model", "SHIPNOTE_MODEL": "shipnote-model"},
+                clear=True,
+            ):
+                load_secrets(required=True)
+                self.assertEqual(os.getenv(AXIS_MODEL_KEY), "axis-model")
 
     def test_shipnote_api_key_defaults_to_openai(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp:
-            secrets_path = Path(tmp) / "secrets.env"
-            _write_secrets(secrets_path, [])
-            with patch("shipnote.config_loader.default_secrets_path", return_value=secrets_path):
-                with patch.dict(os.environ, {"SHIPNOTE_API_KEY": "shipnote-key"}, clear=True):
-                    load_secrets(required=True)
-                    self.assertEqual(os.getenv("OPENAI_API_KEY"), "shipnote-key")
+        secrets_path = self.root / "secrets.env"
+        _write_secrets(secrets_path, [])
+        with set_attr(config_loader, "default_secrets_path", lambda: secrets_path):
+            with patch.dict(os.environ, {"SHIPNOTE_API_KEY": "shipnote-key"}, clear=True):
+                load_secrets(required=True)
+                self.assertEqual(os.getenv("OPENAI_API_KEY"), "shipnote-key")
 
     def test_shipnote_api_key_anthropic_provider_maps_to_anthropic(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp:
-            secrets_path = Path(tmp) / "secrets.env"
-            _write_secrets(secrets_path, [])
-            with patch("shipnote.config_loader.default_secrets_path", return_value=secrets_path):
-                with patch.dict(
-                    os.environ,
-                    {"SHIPNOTE_API_KEY": "shipnote-key", "SHIPNOTE_PROVIDER": "anthropic"},
-                    clear=True,
-                ):
-                    load_secrets(required=True)
-                    self.assertEqual(os.getenv("ANTHROPIC_API_KEY"), "shipnote-key")
-                    self.assertIsNone(os.getenv("OPENAI_API_KEY"))
+        secrets_path = self.root / "secrets.env"
+        _write_secrets(secrets_path, [])
+        with set_attr(config_loader, "default_secrets_path", lambda: secrets_path):
+            with patch.dict(
+                os.environ,
+                {"SHIPNOTE_API_KEY": "shipnote-key", "SHIPNOTE_PROVIDER": "anthropic"},
+                clear=True,
+            ):
+                load_secrets(required=True)
+                self.assertEqual(os.getenv("ANTHROPIC_API_KEY"), "shipnote-key")
+                self.assertIsNone(os.getenv("OPENAI_API_KEY"))
 
     def test_explicit_provider_key_precedes_shipnote_api_alias(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp:
-            secrets_path = Path(tmp) / "secrets.env"
-            _write_secrets(secrets_path, [])
-            with patch("shipnote.config_loader.default_secrets_path", return_value=secrets_path):
-                with patch.dict(
-                    os.environ,
-                    {"OPENAI_API_KEY": "explicit-key", "SHIPNOTE_API_KEY": "shipnote-key"},
-                    clear=True,
-                ):
-                    load_secrets(required=True)
-                    self.assertEqual(os.getenv("OPENAI_API_KEY"), "explicit-key")
+        secrets_path = self.root / "secrets.env"
+        _write_secrets(secrets_path, [])
+        with set_attr(config_loader, "default_secrets_path", lambda: secrets_path):
+            with patch.dict(
+                os.environ,
+                {"OPENAI_API_KEY": "explicit-key", "SHIPNOTE_API_KEY": "shipnote-key"},
+                clear=True,
+            ):
+                load_secrets(required=True)
+                self.assertEqual(os.getenv("OPENAI_API_KEY"), "explicit-key")
 
     def test_process_shipnote_api_precedes_file_provider_key(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp:
-            secrets_path = Path(tmp) / "secrets.env"
-            _write_secrets(secrets_path, ["OPENAI_API_KEY=file-key"])
-            with patch("shipnote.config_loader.default_secrets_path", return_value=secrets_path):
-                with patch.dict(os.environ, {"SHIPNOTE_API_KEY": "env-shipnote-key"}, clear=True):
-                    load_secrets(required=True)
-                    self.assertEqual(os.getenv("OPENAI_API_KEY"), "env-shipnote-key")
+        secrets_path = self.root / "secrets.env"
+        _write_secrets(secrets_path, ["OPENAI_API_KEY=file-key"])
+        with set_attr(config_loader, "default_secrets_path", lambda: secrets_path):
+            with patch.dict(os.environ, {"SHIPNOTE_API_KEY": "env-shipnote-key"}, clear=True):
+                load_secrets(required=True)
+                self.assertEqual(os.getenv("OPENAI_API_KEY"), "env-shipnote-key")
 
     def test_shipnote_aliases_from_secrets_file_are_applied(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp:
-            secrets_path = Path(tmp) / "secrets.env"
-            _write_secrets(
-                secrets_path,
-                [
-                    "SHIPNOTE_API_KEY=file-shipnote-key",
-                    "SHIPNOTE_PROVIDER=anthropic",
-                    "SHIPNOTE_MODEL=file-shipnote-model",
-                ],
-            )
-            with patch("shipnote.config_loader.default_secrets_path", return_value=secrets_path):
-                with patch.dict(os.environ, {}, clear=True):
-                    load_secrets(required=True)
-                    self.assertEqual(os.getenv("ANTHROPIC_API_KEY"), "file-shipnote-key")
-                    self.assertEqual(os.getenv(AXIS_MODEL_KEY), "file-shipnote-model")
+        secrets_path = self.root / "secrets.env"
+        _write_secrets(
+            secrets_path,
+            [
+                "SHIPNOTE_API_KEY=file-shipnote-key",
+                "SHIPNOTE_PROVIDER=anthropic",
+                "SHIPNOTE_MODEL=file-shipnote-model",
+            ],
+        )
+        with set_attr(config_loader, "default_secrets_path", lambda: secrets_path):
+            with patch.dict(os.environ, {}, clear=True):
+                load_secrets(required=True)
+                self.assertEqual(os.getenv("ANTHROPIC_API_KEY"), "file-shipnote-key")
+                self.assertEqual(os.getenv(AXIS_MODEL_KEY), "file-shipnote-model")
 
     def test_invalid_shipnote_provider_raises(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp:
-            secrets_path = Path(tmp) / "secrets.env"
-            _write_secrets(secrets_path, [])
-            with patch("shipnote.config_loader.default_secrets_path", return_value=secrets_path):
-                with patch.dict(
-                    os.environ,
-                    {"SHIPNOTE_API_KEY": "shipnote-key", "SHIPNOTE_PROVIDER": "invalid"},
-                    clear=True,
-                ):
-                    with self.assertRaises(ShipnoteSecretsError):
-                        load_secrets(required=True)
+        secrets_path = self.root / "secrets.env"
+        _write_secrets(secrets_path, [])
+        with set_attr(config_loader, "default_secrets_path", lambda: secrets_path):
+            with patch.dict(
+                os.environ,
+                {"SHIPNOTE_API_KEY": "shipnote-key", "SHIPNOTE_PROVIDER": "invalid"},
+                clear=True,
+            ):
+                with self.assertRaises(ShipnoteSecretsError):
+                    load_secrets(required=True)
 
 
 if __name__ == "__main__":
@@ -1,46 +1,18 @@
 from __future__ import annotations
 
-import tempfile
 import unittest
 from pathlib import Path
 
-from shipnote.config_loader import (
-    ContentBalanceConfig,
-    ContentPolicyConfig,
-    ContextConfig,
-    RepoConfig,
-    SkipPatternsConfig,
-)
+from tests._support import TempRootTestCase, make_repo_config
+from shipnote.config_loader import ContextConfig, RepoConfig
 from shipnote.context_builder import build_context
 from shipnote.errors import ShipnoteConfigError
 from shipnote.git_cli import CommitInfo
 
 
 def _repo_cfg(root: Path, *, additional_files: list[str], max_total_chars: int) -> RepoConfig:
-    shipnote_dir = root / ".shipnote"
-    return RepoConfig(
-        config_path=shipnote_dir / "config.yaml",
-        repo_root=root,
-        shipnote_dir=shipnote_dir,
-        project_name="Test",
-        project_description="Test project",
-        voice_description="Direct",
-        poll_interval_seconds=60,
-        max_drafts_per_commit=3,
-        lookback_commits=10,
-        template_dir=shipnote_dir / "templates",
-        queue_dir=shipnote_dir / "queue",
-        archive_dir=shipnote_dir / "archive",
-        skip_patterns=SkipPatternsConfig(messages=[], files_only=[], min_meaningful_files=1),
-        content_balance=ContentBalanceConfig(authority=30, translation=25, personal=25, growth=20),
-        secret_patterns=[],
-        raw_config={},
-        context=ContextConfig(additional_files=additional_files, max_total_chars=max_total_chars),
-        content_policy=ContentPolicyConfig(
-            focus_topics=["software engineering"],
-            avoid_topics=["politics", "sports", "crypto"],
-            engagement_reminder="Engage in relevant community discussions before and after posting.",
-        ),
+    return make_repo_config(
+        root, context=ContextConfig(additional_files=additional_files, max_total_chars=max_total_chars)
     )
 
 
@@ -69,51 +41,101 @@ def _state() -> dict[str, object]:
     }
 
 
-class ContextBuilderTests(unittest.TestCase):
+class ContextBuilderTests(TempRootTestCase):
     def test_includes_additional_notes_from_allowlisted_files(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp:
-            root = Path(tmp)
-            shipnote_dir = root / ".shipnote"
-            shipnote_dir.mkdir(parents=True, exist_ok=True)
-            (shipnote_dir / "context.md").write_text("alpha", encoding="utf-8")
-            (shipnote_dir / "notes.txt").write_text("beta", encoding="utf-8")
-            cfg = _repo_cfg(
-                root,
-                additional_files=[".shipnote/context.md", ".shipnote/notes.txt"],
-                max_total_chars=100,
-            )
+        root = self.root
+        shipnote_dir = root / ".shipnote"
+        shipnote_dir.mkdir(parents=True, exist_ok=True)
+        (shipnote_dir / "context.md").write_text("alpha", encoding="utf-8")
+        (shipnote_dir / "notes.txt").write_text("beta", encoding="utf-8")
+        cfg = _repo_cfg(
+            root,
+            additional_files=[".shipnote/context.md", ".shipnote/notes.txt"],
+            max_total_chars=100,
+        )
+
+        payload = build_context(
+            repo_cfg=cfg,
+            commit=_commit(),
+            files_changed=["shipnote/context_builder.py"],
+            sanitized_diff="+context",
+            current_branch="main",
+            recent_history=["one", "two"],
+            state=_state(),
+        )
+
+        self.assertEqual(
+            payload["additional_notes"],
+            [
+                {"path": ".shipnote/context.md", "content": "alpha"},
+                {"path": ".shipnote/notes.txt", "content": "beta"},
+            ],
+        )
+
+    def test_note_swapped_for_outside_symlink_is_rejected_on_next_build(self) -> None:
+        root = self.root / "repo"
+        shipnote_dir = root / ".shipnote"
+        shipnote_dir.mkdir(parents=True)
+        note = shipnote_dir / "context.md"
+        note.write_text("alpha", encoding="utf-8")
+        outside = self.root / "secret.md"
+        outside.write_text("TOP SECRET", encoding="utf-8")
+        cfg = _repo_cfg(root, additional_files=[".shipnote/context.md"], max_total_chars=100)
+        kwargs = {
+            "repo_cfg": cfg,
+            "commit": _commit(),
+            "files_changed": [],
+            "sanitized_diff": "",
+            "current_branch": "main",
+            "recent_history": [],
+            "state": _state(),
+        }
 
-            payload = build_context(
-                repo_cfg=cfg,
-                commit=_commit(),
-                files_changed=["shipnote/context_builder.py"],
-                sanitized_diff="+context",
-                current_branch="main",
-                recent_history=["one", "two"],
-                state=_state(),
-            )
+        payload = build_context(**kwargs)
+        self.assertEqual(payload["additional_notes"], [{"path": ".shipnote/context.md", "content": "alpha"}])
 
-            self.assertEqual(
-                payload["additional_notes"],
-                [
-                    {"path": ".shipnote/context.md", "content": "alpha"},
-                    {"path": ".shipnote/notes.txt", "content": "beta"},
-                ],
-            )
+        note.unlink()
+        try:
+            note.symlink_to(outside)
+        except OSError as exc:
+            self.skipTest(f"symlinks unavailable: {exc}")
+
+        with self.assertRaises(ShipnoteConfigError):
+            build_context(**kwargs)
 
     def test_missing_additional_note_file_is_skipped(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp:
-            root = Path(tmp)
-            shipnote_dir = root / ".shipnote"
-            shipnote_dir.mkdir(parents=True, exist_ok=True)
-            (shipnote_dir / "context.md").write_text("alpha", encoding="utf-8")
-            cfg = _repo_cfg(
-                root,
-                additional_files=[".shipnote/context.md", ".shipnote/missing.md"],
-                max_total_chars=100,
-            )
+        root = self.root
+        shipnote_dir = root / ".shipnote"
+        shipnote_dir.mkdir(parents=True, exist_ok=True)
+        (shipnote_dir / "context.md").write_text("alpha", encoding="utf-8")
+        cfg = _repo_cfg(
+            root,
+            additional_files=[".shipnote/context.md", ".shipnote/missing.md"],
+            max_total_chars=100,
+        )
+
+        payload = build_context(
+            repo_cfg=cfg,
+            commit=_commit(),
+            files_changed=["shipnote/context_builder.py"],
+            sanitized_diff="+context",
+            current_branch="main",
+            recent_history=["one", "two"],
+            state=_state(),
+        )
+
+        self.assertEqual(payload["additional_notes"], [{"path": ".shipnote/context.md", "content": "alpha"}])
 
-            payload = build_context(
+    def test_rejects_additional_note_outside_dot_shipnote(self) -> None:
+        root = self.root
+        cfg = _repo_cfg(
+            root,
+            additional_files=["docs/context.md"],
+            max_total_chars=100,
+        )
+
+        with self.assertRaises(ShipnoteConfigError):
+            build_context(
                 repo_cfg=cfg,
                 commit=_commit(),
                 files_changed=["shipnote/context_builder.py"],
@@ -123,65 +145,19 @@ class ContextBuilderTests(unittest.TestCase):
                 state=_state(),
             )
 
-            self.assertEqual(payload["additional_notes"], [{"path": ".shipnote/context.md", "content": "alpha"}])
-
-    def test_rejects_additional_note_outside_dot_shipnote(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp:
-            root = Path(tmp)
-            cfg = _repo_cfg(
-                root,
-                additional_files=["docs/context.md"],
-                max_total_chars=100,
-            )
-
-            with self.assertRaises(ShipnoteConfigError):
-                build_context(
-                    repo_cfg=cfg,
-                    commit=_commit(),
-                    files_changed=["shipnote/context_builder.py"],
-                    sanitized_diff="+context",
-                    current_branch="main",
-                    recent_history=["one", "two"],
-                    state=_state(),
-                )
-
     def test_rejects_additional_note_with_non_allowlisted_extension(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp:
-            root = Path(tmp)
-            shipnote_dir = root / ".shipnote"
-            shipnote_dir.mkdir(parents=True, exist_ok=True)
-            (shipnote_dir / "context.yaml").write_text("alpha", encoding="utf-8")
-            cfg = _repo_cfg(
-                root,
-                additional_files=[".shipnote/context.yaml"],
-                max_total_chars=100,
-            )
-
-            with self.assertRaises(ShipnoteConfigError):
-                build_context(
-                    repo_cfg=cfg,
-                    commit=_commit(),
-                    files_changed=["shipnote/context_builder.py"],
-                    sanitized_diff="+context",
-                    current_branch="main",
-                    recent_history=["one", "two"],
-                    state=_state(),
-                )
-
-    def test_truncates_additional_notes_to_max_total_chars(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp:
-            root = Path(tmp)
-            shipnote_dir = root / ".shipnote"
-            shipnote_dir.mkdir(parents=True, exist_ok=True)
-            (shipnote_dir / "a.md").write_text("abcdefgh", encoding="utf-8")
-            (shipnote_dir / "b.txt").write_text("ijklmnop", encoding="utf-8")
-            cfg = _repo_cfg(
-                root,
-                additional_files=[".shipnote/a.md", ".shipnote/b.txt"],
-                max_total_chars=10,
-            )
-
-            payload = build_context(
+        root = self.root
+        shipnote_dir = root / ".shipnote"
+        shipnote_dir.mkdir(parents=True, exist_ok=True)
+        (shipnote_dir / "context.yaml").write_text("alpha", encoding="utf-8")
+        cfg = _repo_cfg(
+            root,
+            additional_files=[".shipnote/context.yaml"],
+            max_total_chars=100,
+        )
+
+        with self.assertRaises(ShipnoteConfigError):
+            build_context(
                 repo_cfg=cfg,
                 commit=_commit(),
                 files_changed=["shipnote/context_builder.py"],
@@ -191,10 +167,32 @@ class ContextBuilderTests(unittest.TestCase):
                 state=_state(),
             )
 
-            self.assertEqual(payload["additional_notes"][0]["content"], "abcdefgh")
-            self.assertEqual(payload["additional_notes"][1]["content"], "ij")
-            total = sum(len(item["content"]) for item in payload["additional_notes"])
-            self.assertEqual(total, 10)
+    def test_truncates_additional_notes_to_max_total_chars(self) -> None:
+        root = self.root
+        shipnote_dir = root / ".shipnote"
+        shipnote_dir.mkdir(parents=True, exist_ok=True)
+        (shipnote_dir / "a.md").write_text("abcdefgh", encoding="utf-8")
+        (shipnote_dir / "b.txt").write_text("ijklmnop", encoding="utf-8")
+        cfg = _repo_cfg(
+            root,
+            additional_files=[".shipnote/a.md", ".shipnote/b.txt"],
+            max_total_chars=10,
+        )
+
+        payload = build_context(
+            repo_cfg=cfg,
+            commit=_commit(),
+            files_changed=["shipnote/context_builder.py"],
+            sanitized_diff="+context",
+            current_branch="main",
+            recent_history=["one", "two"],
+            state=_state(),
+        )
+
+        self.assertEqual(payload["additional_notes"][0]["content"], "abcdefgh")
+        self.assertEqual(payload["additional_notes"][1]["content"], "ij")
+        total = sum(len(item["content"]) for item in payload["additional_notes"])
+        self.assertEqual(total, 10)
 
 
 if __name__ == "__main__":
@@ -1,24 +1,28 @@
 from __future__ import annotations
 
+import json
+import os
 import unittest
 from pathlib import Path
 from types import SimpleNamespace
-from unittest.mock import MagicMock, patch
-
-from shipnote.config_loader import (
-    ContentBalanceConfig,
-    ContentPolicyConfig,
-    ContextConfig,
-    RepoConfig,
-    SkipPatternsConfig,
-    TemplatePreferencesConfig,
+from unittest.mock import Mock, patch
+
+from tests._support import make_repo_config
+from shipnote import generation
+from shipnote.config_loader import TemplatePreferencesConfig
+from shipnote.generation import (
+    PRETTY_CONTEXT_ENV,
+    _build_user_prompt,
+    _extract_json_object,
+    generate_drafts,
 )
-from shipnote.generation import generate_drafts
 
 
-def _repo_cfg(*, template_preferences: TemplatePreferencesConfig | None = None) -> RepoConfig:
-    root = Path("/tmp/shipnote")
-    prefs = template_preferences or TemplatePreferencesConfig(
+_ROOT = Path("/tmp/shipnote")
+# RepoConfig is frozen, so one instance is shared by every test in this module.
+_REPO_CFG = make_repo_config(
+    _ROOT,
+    template_preferences=TemplatePreferencesConfig(
         content_category_default_by_template={
             "authority": "AI-Curious Builder",
             "translation": "cross-group",
@@ -35,158 +39,106 @@ def _repo_cfg(*, template_preferences: TemplatePreferencesConfig | None = None)
             "thread": True,
             "weekly_wrapup": True,
         },
-    )
-    return RepoConfig(
-        config_path=root / ".shipnote" / "config.yaml",
-        repo_root=root,
-        shipnote_dir=root / ".shipnote",
-        project_name="Shipnote",
-        project_description="Draft generator",
-        voice_description="Direct",
-        poll_interval_seconds=60,
-        max_drafts_per_commit=3,
-        lookback_commits=10,
-        template_dir=root / ".shipnote" / "templates",
-        queue_dir=root / ".shipnote" / "queue",
-        archive_dir=root / ".shipnote" / "archive",
-        skip_patterns=SkipPatternsConfig(messages=[], files_only=[], min_meaningful_files=1),
-        content_balance=ContentBalanceConfig(authority=30, translation=25, personal=25, growth=20),
-        secret_patterns=[],
-        raw_config={},
-        context=ContextConfig(additional_files=[".shipnote/context.md"], max_total_chars=12000),
-        content_policy=ContentPolicyConfig(
-            focus_topics=["python tooling"],
-            avoid_topics=["politics", "sports"],
-            engagement_reminder="Engage in relevant places.",
-        ),
-        template_preferences=prefs,
-    )
+    ),
+)
 
 
-class GenerationTests(unittest.TestCase):
-    @patch("shipnote.generation.Timeouts")
-    @patch("shipnote.generation.RetryPolicy")
-    @patch("shipnote.generation.Agent")
-    @patch("shipnote.generation.build_generation_system_prompt")
-    def test_generate_drafts_uses_centralized_system_prompt(
-        self,
-        mock_build_prompt: MagicMock,
-        mock_agent_cls: MagicMock,
-        mock_retry_policy: MagicMock,
-        mock_timeouts: MagicMock,
-    ) -> None:
-        repo_cfg = _repo_cfg()
-        mock_build_prompt.return_value = "SYSTEM_FROM_BUILDER"
-        mock_retry_policy.return_value = object()
-        mock_timeouts.return_value = object()
-
-        agent = MagicMock()
-        agent.run.return_value = SimpleNamespace(
-            success=True,
-            output_raw=(
-                '{"drafts":[{"template_type":"authority","content_category":"AI-Curious Builder",'
-                '"suggested_time":"weekday_morning","target_signals":["dwell_time","profile_click"],'
-                '"is_thread":false,"content":"A useful draft"}]}'
-            ),
-            error=None,
-        )
-        mock_agent_cls.return_value = agent
+# Built once and reused by every agent stub; each case picks its run result from _RESPONSES.
+_AGENT = Mock(spec=["run"])
+_RETRY_SENTINEL = object()
+_TIMEOUTS_SENTINEL = object()
 
-        result = generate_drafts(
-            repo_cfg=repo_cfg,
-            context={},
-            templates={},
-            max_drafts=1,
-        )
 
-        self.assertEqual(len(result["drafts"]), 1)
-        mock_build_prompt.assert_called_once_with(repo_cfg)
-        self.assertEqual(mock_agent_cls.call_args.kwargs["system"], "SYSTEM_FROM_BUILDER")
-
-    @patch("shipnote.generation.Timeouts")
-    @patch("shipnote.generation.RetryPolicy")
-    @patch("shipnote.generation.Agent")
-    @patch("shipnote.generation.build_generation_system_prompt")
-    def test_generate_drafts_filters_ineligible_thread_drafts(
-        self,
-        mock_build_prompt: MagicMock,
-        mock_agent_cls: MagicMock,
-        mock_retry_policy: MagicMock,
-        mock_timeouts: MagicMock,
-    ) -> None:
-        repo_cfg = _repo_cfg(
-            template_preferences=TemplatePreferencesConfig(
-                content_category_default_by_template={"authority": "AI-Curious Builder"},
-                is_thread_eligible_by_template={"authority": False},
-            )
-        )
-        mock_build_prompt.return_value = "SYSTEM_FROM_BUILDER"
-        mock_retry_policy.return_value = object()
-        mock_timeouts.return_value = object()
-
-        agent = MagicMock()
-        agent.run.return_value = SimpleNamespace(
-            success=True,
-            output_raw=(
-                '{"drafts":[{"template_type":"authority","content_category":"AI-Curious Builder",'
-                '"suggested_time":"weekday_morning","target_signals":["dwell_time","profile_click"],'
-                '"is_thread":true,"content":"A thread that should be dropped"}]}'
-            ),
-            error=None,
-        )
-        mock_agent_cls.return_value = agent
+_DRAFT = {
+    "template_type": "authority",
+    "content_category": "AI-Curious Builder",
+    "suggested_time": "weekday_morning",
+    "target_signals": ["dwell_time", "profile_click"],
+    "is_thread": False,
+    "content": "A useful draft",
+}
 
-        result = generate_drafts(
-            repo_cfg=repo_cfg,
-            context={},
-            templates={},
-            max_drafts=1,
-        )
 
-        self.assertEqual(result["drafts"], [])
-
-    @patch("shipnote.generation.Timeouts")
-    @patch("shipnote.generation.RetryPolicy")
-    @patch("shipnote.generation.Agent")
-    @patch("shipnote.generation.build_generation_system_prompt")
-    def test_generate_drafts_keeps_eligible_thread_drafts(
-        self,
-        mock_build_prompt: MagicMock,
-        mock_agent_cls: MagicMock,
-        mock_retry_policy: MagicMock,
-        mock_timeouts: MagicMock,
-    ) -> None:
-        repo_cfg = _repo_cfg(
-            template_preferences=TemplatePreferencesConfig(
-                content_category_default_by_template={"thread": "AI-Curious Builder"},
-                is_thread_eligible_by_template={"thread": True},
-            )
-        )
-        mock_build_prompt.return_value = "SYSTEM_FROM_BUILDER"
-        mock_retry_policy.return_value = object()
-        mock_timeouts.return_value = object()
-
-        agent = MagicMock()
-        agent.run.return_value = SimpleNamespace(
-            success=True,
-            output_raw=(
-                '{"drafts":[{"template_type":"thread","content_category":"AI-Curious Builder",'
-                '"suggested_time":"weekday_morning","target_signals":["dwell_time","profile_click"],'
-                '"is_thread":true,"content":"A thread that should remain"}]}'
-            ),
-            error=None,
-        )
-        mock_agent_cls.return_value = agent
+def _draft_output(template_type: str, is_thread: bool) -> str:
+    draft = {**_DRAFT, "template_type": template_type, "is_thread": is_thread}
+    return json.dumps({"drafts": [draft]}, separators=(",", ":"))
 
-        result = generate_drafts(
-            repo_cfg=repo_cfg,
-            context={},
-            templates={},
-            max_drafts=1,
-        )
 
-        self.assertEqual(len(result["drafts"]), 1)
-        self.assertTrue(result["drafts"][0]["is_thread"])
+_RESPONSES = {
+    key: SimpleNamespace(success=True, output_raw=_draft_output(*key), error=None)
+    for key in (("authority", False), ("authority", True), ("thread", True))
+}
+
+
+class GenerationTests(unittest.TestCase):
+    def _stub_agent(self) -> tuple[Mock, Mock]:
+        """Swap the agent-facing names in shipnote.generation for mocks until the test ends."""
+        build_prompt = Mock(return_value="SYSTEM_FROM_BUILDER")
+        _AGENT.run.reset_mock()
+        agent_cls = Mock(return_value=_AGENT)
+        stubs = {
+            "build_generation_system_prompt": build_prompt,
+            "Agent": agent_cls,
+            "RetryPolicy": lambda *args, **kwargs: _RETRY_SENTINEL,
+            "Timeouts": lambda *args, **kwargs: _TIMEOUTS_SENTINEL,
+        }
+        for name, value in stubs.items():
+            self.addCleanup(setattr, generation, name, getattr(generation, name))
+            setattr(generation, name, value)
+        return build_prompt, agent_cls
+
+    def test_generate_drafts_uses_centralized_prompt_and_thread_eligibility(self) -> None:
+        mock_build_prompt, mock_agent_cls = self._stub_agent()
+        # _REPO_CFG marks "thread" as thread-eligible and "authority" as not.
+        cases = [
+            ("authority", False, 1),
+            ("authority", True, 0),
+            ("thread", True, 1),
+        ]
+        for template_type, is_thread, expected_len in cases:
+            with self.subTest(template_type=template_type, is_thread=is_thread):
+                mock_build_prompt.reset_mock()
+                _AGENT.run.return_value = _RESPONSES[template_type, is_thread]
+
+                result = generate_drafts(
+                    repo_cfg=_REPO_CFG,
+                    context={},
+                    templates={},
+                    max_drafts=1,
+                )
+
+                self.assertEqual(len(result["drafts"]), expected_len)
+                if expected_len:
+                    self.assertEqual(result["drafts"][0]["is_thread"], is_thread)
+                mock_build_prompt.assert_called_once_with(_REPO_CFG)
+                agent_kwargs = mock_agent_cls.call_args.kwargs
+                self.assertEqual(agent_kwargs["system"], "SYSTEM_FROM_BUILDER")
+                self.assertIs(agent_kwargs["retry"], _RETRY_SENTINEL)
+                self.assertIs(agent_kwargs["timeouts"], _TIMEOUTS_SENTINEL)
+
+    def test_user_prompt_serializes_context_compactly_by_default(self) -> None:
+        context = {"project": {"name": "Shipnote"}, "recent_history": ["one"]}
+        with patch.dict(os.environ, {}, clear=True):
+            prompt = _build_user_prompt(_REPO_CFG, context, {}, 1)
+
+        self.assertIn('{"project":{"name":"Shipnote"},"recent_history":["one"]}', prompt)
+
+    def test_user_prompt_pretty_prints_context_when_requested(self) -> None:
+        context = {"project": {"name": "Shipnote"}}
+        with patch.dict(os.environ, {PRETTY_CONTEXT_ENV: "1"}, clear=True):
+            prompt = _build_user_prompt(_REPO_CFG, context, {}, 1)
+
+        self.assertIn('{\n  "project": {\n    "name": "Shipnote"\n  }\n}', prompt)
+
+    def test_extract_json_object_ignores_braces_inside_strings(self) -> None:
+        text = 'Here you go: {"drafts": [{"content": "use {braces} and \\"quotes\\" }"}]} trailing }'
+
+        self.assertEqual(
+            _extract_json_object(text),
+            '{"drafts": [{"content": "use {braces} and \\"quotes\\" }"}]}',
+        )
+        with self.assertRaises(ValueError):
+            _extract_json_object('{"drafts": [')
 
 
 if __name__ == "__main__":
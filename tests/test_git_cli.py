@@ -1,56 +1,101 @@
 from __future__ import annotations
 
+import os
+import shlex
+import shutil
 import subprocess
-import tempfile
 import unittest
 from pathlib import Path
 
+from tests._support import GIT, GIT_ENV, TempRootTestCase, slow
 from shipnote.errors import ShipnoteGitError
-from shipnote.git_cli import get_branch_name, list_new_commits
+from shipnote.git_cli import commit_in_history, get_branch_name, list_new_commits
 
 
-def _run(repo: Path, args: list[str]) -> None:
-    subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True, text=True)
+def _run(repo: Path, args: list[str]) -> str:
+    return subprocess.run(
+        [GIT, *args], cwd=repo, env=GIT_ENV, check=True, capture_output=True, text=True
+    ).stdout
 
 
-class GitCliTests(unittest.TestCase):
+def _git_batch(repo: Path, commands: list[list[str]]) -> str:
+    """Run several git commands in one shell spawn where a POSIX shell exists; return their stdout."""
+    if os.name != "posix":
+        return "".join(_run(repo, args) for args in commands)
+    script = " && ".join(shlex.join([GIT, *args]) for args in commands)
+    return subprocess.run(
+        ["sh", "-c", script], cwd=repo, env=GIT_ENV, check=True, capture_output=True, text=True
+    ).stdout
+
+
+def _head_sha(repo: Path) -> str:
+    """Resolve HEAD by reading .git directly instead of spawning `git rev-parse`."""
+    git_dir = repo / ".git"
+    head = (git_dir / "HEAD").read_text(encoding="utf-8").strip()
+    if not head.startswith("ref: "):
+        return head
+    ref = head[5:]
+    ref_path = git_dir / ref
+    if ref_path.exists():
+        return ref_path.read_text(encoding="utf-8").strip()
+    for line in (git_dir / "packed-refs").read_text(encoding="utf-8").splitlines():
+        sha, _, name = line.partition(" ")
+        if name == ref:
+            return sha
+    raise LookupError(f"unresolved ref: {ref}")
+
+
+class GitCliTests(TempRootTestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        # One committed repo shared by read-only tests; tests that rewrite history copy it.
+        cls._repo = Path(cls._tmp) / "shared"
+        cls._repo.mkdir()
+        (cls._repo / "a.txt").write_text("a\n", encoding="utf-8")
+        cls._blob = _git_batch(
+            cls._repo,
+            [
+                ["init", "-q"],
+                ["config", "user.email", "test@example.com"],
+                ["config", "user.name", "Tester"],
+                ["add", "a.txt"],
+                ["commit", "-q", "-m", "first"],
+                ["rev-parse", "HEAD:a.txt"],
+            ],
+        ).strip()
+        cls._first = _head_sha(cls._repo)
+
     def test_branch_name_on_unborn_repo(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp:
-            repo = Path(tmp) / "repo"
-            repo.mkdir(parents=True, exist_ok=True)
-            _run(repo, ["init", "-q"])
-            branch = get_branch_name(repo)
-            self.assertTrue(branch)
+        repo = self.root / "repo"
+        repo.mkdir(parents=True, exist_ok=True)
+        _run(repo, ["init", "-q"])
+        branch = get_branch_name(repo)
+        self.assertTrue(branch)
 
+    @slow
     def test_list_new_commits_detects_rewritten_history(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp:
-            repo = Path(tmp) / "repo"
-            repo.mkdir(parents=True, exist_ok=True)
-            _run(repo, ["init", "-q"])
-            _run(repo, ["config", "user.email", "test@example.com"])
-            _run(repo, ["config", "user.name", "Tester"])
-
-            (repo / "a.txt").write_text("a\n", encoding="utf-8")
-            _run(repo, ["add", "a.txt"])
-            _run(repo, ["commit", "-m", "first"])
-            first = subprocess.check_output(
-                ["git", "rev-parse", "HEAD"], cwd=repo, text=True
-            ).strip()
-
-            (repo / "a.txt").write_text("a\nb\n", encoding="utf-8")
-            _run(repo, ["add", "a.txt"])
-            _run(repo, ["commit", "-m", "second"])
-            second = subprocess.check_output(
-                ["git", "rev-parse", "HEAD"], cwd=repo, text=True
-            ).strip()
-
-            _run(repo, ["reset", "--hard", first])
-            (repo / "a.txt").write_text("a\nc\n", encoding="utf-8")
-            _run(repo, ["add", "a.txt"])
-            _run(repo, ["commit", "-m", "after-rewrite"])
-
-            with self.assertRaises(ShipnoteGitError):
-                list_new_commits(repo, second)
+        repo = Path(shutil.copytree(self._repo, self.root / "repo"))
+        (repo / "a.txt").write_text("a\nb\n", encoding="utf-8")
+        second = _git_batch(
+            repo,
+            [
+                ["commit", "-q", "-am", "second"],
+                ["rev-parse", "HEAD"],
+                ["reset", "-q", "--hard", self._first],
+                ["commit", "-q", "--allow-empty", "-m", "after-rewrite"],
+            ],
+        ).strip()
+
+        with self.assertRaises(ShipnoteGitError):
+            list_new_commits(repo, second)
+
+    def test_commit_in_history_rejects_unknown_and_non_commit_objects(self) -> None:
+        repo = self._repo
+
+        self.assertTrue(commit_in_history(repo, self._first))
+        self.assertFalse(commit_in_history(repo, self._blob))
+        self.assertFalse(commit_in_history(repo, "0" * len(self._first)))
 
 
 if __name__ == "__main__":
@@ -1,24 +1,44 @@
 from __future__ import annotations
 
 import unittest
+from fnmatch import fnmatch
 
 from shipnote.config_loader import SkipPatternsConfig
-from shipnote.heuristic_filter import should_keep_commit
+from shipnote.heuristic_filter import _matches_any_file_pattern, should_keep_commit
 
 
 class HeuristicFilterTests(unittest.TestCase):
-    def setUp(self) -> None:
-        self.cfg = SkipPatternsConfig(
-            messages=[r"^wip", r"^fix typo"],
-            files_only=["*.lock", ".env*"],
-            min_meaningful_files=1,
-        )
+    # Frozen and precompiled, so every test shares one instance.
+    cfg = SkipPatternsConfig(
+        messages=[r"^wip", r"^fix typo"],
+        files_only=["*.lock", ".env*"],
+        min_meaningful_files=1,
+    )
 
     def test_skips_matching_message_pattern(self) -> None:
         keep, reason = should_keep_commit("wip save", ["src/main.py"], self.cfg)
         self.assertFalse(keep)
         self.assertIn("message matched", reason)
 
+    def test_message_patterns_are_precompiled_case_insensitive(self) -> None:
+        self.assertEqual([p.pattern for p in self.cfg.compiled_messages], self.cfg.messages)
+
+        keep, reason = should_keep_commit("WIP: save", ["src/main.py"], self.cfg)
+
+        self.assertFalse(keep)
+        self.assertIn("'^wip'", reason)
+
+    def test_file_globs_fold_into_one_regex_matching_fnmatch(self) -> None:
+        paths = ["package.lock", ".env.local", "src/app.lock", "lock", "env", "src/.env", "a.lockfile"]
+
+        for path in paths:
+            with self.subTest(path=path):
+                self.assertEqual(
+                    _matches_any_file_pattern(path, self.cfg.compiled_files_only),
+                    any(fnmatch(path, pattern) for pattern in self.cfg.files_only),
+                )
+        self.assertFalse(_matches_any_file_pattern("package.lock", None))
+
     def test_skips_when_only_ignored_files_changed(self) -> None:
         keep, reason = should_keep_commit("deps update", ["package.lock", ".env.local"], self.cfg)
         self.assertFalse(keep)
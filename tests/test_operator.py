@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import io
+import unittest
+from contextlib import redirect_stdout
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from tests._support import TempRootTestCase
+from shipnote.operator import _list_markdown_files, run_chat
+
+
+class OperatorChatTests(unittest.TestCase):
+    def _run_chat(self, responses: list[str], session: MagicMock) -> str:
+        agent = MagicMock()
+        agent.session.return_value = session
+        out = io.StringIO()
+        with patch("shipnote.operator._build_operator_agent", return_value=agent):
+            with patch("builtins.input", side_effect=responses):
+                with redirect_stdout(out):
+                    code = run_chat("unused/config.yaml")
+        self.assertEqual(code, 0)
+        return out.getvalue()
+
+    def test_repeated_follow_ups_always_reach_the_session(self) -> None:
+        session = MagicMock()
+        session.run.side_effect = [
+            SimpleNamespace(output_raw="First part."),
+            SimpleNamespace(output_raw="Second part."),
+        ]
+
+        out = self._run_chat(["continue", "continue", "exit"], session)
+
+        self.assertEqual(session.run.call_count, 2)
+        self.assertIn("First part.", out)
+        self.assertIn("Second part.", out)
+
+
+class MarkdownListingTests(TempRootTestCase):
+    def test_lists_only_markdown_files_sorted(self) -> None:
+        root = self.root
+        for name in ("002_b.md", "001_a.md", "notes.txt"):
+            (root / name).write_text("x", encoding="utf-8")
+        (root / "nested.md").mkdir()
+
+        self.assertEqual(_list_markdown_files(root), [root / "001_a.md", root / "002_b.md"])
+        self.assertEqual(_list_markdown_files(root / "missing"), [])
+        self.assertEqual(_list_markdown_files(root / "notes.txt"), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
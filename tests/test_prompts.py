@@ -1,56 +1,38 @@
 from __future__ import annotations
 
 import unittest
+from dataclasses import replace
 from pathlib import Path
 
-from shipnote.config_loader import (
-    ContentBalanceConfig,
-    ContentPolicyConfig,
-    ContextConfig,
-    RepoConfig,
-    SkipPatternsConfig,
-    TemplatePreferencesConfig,
-)
+from tests._support import make_repo_config
+from shipnote.config_loader import ContentPolicyConfig, TemplatePreferencesConfig
 from shipnote.prompts import build_generation_system_prompt
 
 
+_ROOT = Path("/tmp/shipnote")
+_REPO_CFG = make_repo_config(
+    _ROOT,
+    content_policy=ContentPolicyConfig(
+        focus_topics=["python tooling", "developer systems"],
+        avoid_topics=["politics", "sports"],
+        engagement_reminder="Engage where your users already discuss this topic.",
+    ),
+    template_preferences=TemplatePreferencesConfig(
+        content_category_default_by_template={
+            "authority": "AI-Curious Builder",
+            "weekly_wrapup": "cross-group",
+        },
+        is_thread_eligible_by_template={
+            "authority": False,
+            "weekly_wrapup": True,
+        },
+    ),
+)
+
+
 class PromptTests(unittest.TestCase):
     def test_build_generation_system_prompt_includes_configured_policy(self) -> None:
-        root = Path("/tmp/shipnote")
-        cfg = RepoConfig(
-            config_path=root / ".shipnote" / "config.yaml",
-            repo_root=root,
-            shipnote_dir=root / ".shipnote",
-            project_name="Shipnote",
-            project_description="Draft generator",
-            voice_description="Direct",
-            poll_interval_seconds=60,
-            max_drafts_per_commit=3,
-            lookback_commits=10,
-            template_dir=root / ".shipnote" / "templates",
-            queue_dir=root / ".shipnote" / "queue",
-            archive_dir=root / ".shipnote" / "archive",
-            skip_patterns=SkipPatternsConfig(messages=[], files_only=[], min_meaningful_files=1),
-            content_balance=ContentBalanceConfig(authority=30, translation=25, personal=25, growth=20),
-            secret_patterns=[],
-            raw_config={},
-            context=ContextConfig(additional_files=[".shipnote/context.md"], max_total_chars=12000),
-            content_policy=ContentPolicyConfig(
-                focus_topics=["python tooling", "developer systems"],
-                avoid_topics=["politics", "sports"],
-                engagement_reminder="Engage where your users already discuss this topic.",
-            ),
-            template_preferences=TemplatePreferencesConfig(
-                content_category_default_by_template={
-                    "authority": "AI-Curious Builder",
-                    "weekly_wrapup": "cross-group",
-                },
-                is_thread_eligible_by_template={
-                    "authority": False,
-                    "weekly_wrapup": True,
-                },
-            ),
-        )
+        cfg = _REPO_CFG
 
         prompt = build_generation_system_prompt(cfg)
 
@@ -62,6 +44,20 @@ class PromptTests(unittest.TestCase):
         self.assertIn("authority -> AI-Curious Builder", prompt)
         self.assertIn("weekly_wrapup -> true", prompt)
 
+    def test_build_generation_system_prompt_tracks_policy_changes(self) -> None:
+        cfg = _REPO_CFG
+        first = build_generation_system_prompt(cfg)
+        self.assertEqual(build_generation_system_prompt(cfg), first)
+
+        changed = replace(
+            cfg,
+            content_policy=replace(cfg.content_policy, focus_topics=["release engineering"]),
+        )
+        prompt = build_generation_system_prompt(changed)
+
+        self.assertIn("Stay inside focus topics: release engineering", prompt)
+        self.assertNotEqual(prompt, first)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,60 +1,134 @@
 from __future__ import annotations
 
-import subprocess
-import tempfile
 import unittest
+import zipfile
 from pathlib import Path
+from unittest.mock import patch
 
+from tests._support import TempRootTestCase, slow
 from shipnote.errors import ShipnoteConfigError
-from shipnote.scaffold import bootstrap_repo
-
-
-def _run(repo: Path, args: list[str]) -> None:
-    subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True, text=True)
-
-
-class ScaffoldTests(unittest.TestCase):
-    def test_bootstrap_writes_config_and_templates(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp:
-            repo = Path(tmp) / "repo"
-            repo.mkdir(parents=True, exist_ok=True)
-            _run(repo, ["init", "-q"])
-
-            result = bootstrap_repo(repo_path=repo, poll_interval_seconds=45)
-            self.assertTrue(result.config_path.exists())
-            self.assertTrue(result.created_config)
-            self.assertGreaterEqual(result.template_count_written, 6)
-
-            config_text = result.config_path.read_text(encoding="utf-8")
-            self.assertIn("poll_interval_seconds: 45", config_text)
-            self.assertIn('template_dir: ".shipnote/templates"', config_text)
-            self.assertIn('queue_dir: ".shipnote/drafts"', config_text)
-            self.assertNotIn("Builder-in-public", config_text)
-            self.assertIn("context:", config_text)
-            self.assertIn("additional_files:", config_text)
-            self.assertIn("max_total_chars: 12000", config_text)
-            self.assertIn("content_policy:", config_text)
-            self.assertIn("focus_topics:", config_text)
-            self.assertIn("avoid_topics:", config_text)
-            self.assertIn("engagement_reminder:", config_text)
-            self.assertTrue((repo / ".shipnote" / "drafts").exists())
-            authority_text = (repo / ".shipnote" / "templates" / "authority.md").read_text(encoding="utf-8")
-            self.assertNotIn("Building this in public", authority_text)
+from shipnote.scaffold import (
+    _bundled_template_paths,
+    _get_bundled_templates,
+    _write_bytes_atomic,
+    _yaml_quote,
+    bootstrap_repo,
+)
+from shipnote.template_loader import STANDARD_TEMPLATE_FILES
+
+
+class BootstrappedRepoTests(TempRootTestCase):
+    """Assertions about a single fresh bootstrap_repo run, shared by the whole class."""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.repo = Path(cls._tmp) / "repo"
+        # bootstrap_repo only checks for a .git directory, so skip the git init fork.
+        (cls.repo / ".git").mkdir(parents=True)
+        cls.result = bootstrap_repo(repo_path=cls.repo, poll_interval_seconds=45)
+        cls.config_text = cls.result.config_path.read_text(encoding="utf-8")
+
+    def test_reports_created_config_and_templates(self) -> None:
+        self.assertTrue(self.result.config_path.exists())
+        self.assertTrue(self.result.created_config)
+        self.assertGreaterEqual(self.result.template_count_written, 6)
+
+    def test_config_carries_poll_interval_and_default_dirs(self) -> None:
+        self.assertIn("poll_interval_seconds: 45", self.config_text)
+        self.assertIn('template_dir: ".shipnote/templates"', self.config_text)
+        self.assertIn('queue_dir: ".shipnote/drafts"', self.config_text)
+        self.assertNotIn("Builder-in-public", self.config_text)
+
+    def test_config_includes_context_and_content_policy_sections(self) -> None:
+        for snippet in (
+            "context:",
+            "additional_files:",
+            "max_total_chars: 12000",
+            "content_policy:",
+            "focus_topics:",
+            "avoid_topics:",
+            "engagement_reminder:",
+        ):
+            self.assertIn(snippet, self.config_text)
+
+    def test_creates_drafts_dir_and_neutral_templates(self) -> None:
+        self.assertTrue((self.repo / ".shipnote" / "drafts").exists())
+        authority_text = (self.repo / ".shipnote" / "templates" / "authority.md").read_text(encoding="utf-8")
+        self.assertNotIn("Building this in public", authority_text)
+
+
+class ScaffoldTests(TempRootTestCase):
+    def _marked_git_repo(self) -> Path:
+        repo = self.root / "repo"
+        (repo / ".git").mkdir(parents=True)
+        return repo
 
     def test_bootstrap_requires_git_without_init_flag(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp:
-            repo = Path(tmp) / "repo"
-            repo.mkdir(parents=True, exist_ok=True)
-            with self.assertRaises(ShipnoteConfigError):
-                bootstrap_repo(repo_path=repo, init_git=False)
+        repo = self.root / "repo"
+        repo.mkdir(parents=True, exist_ok=True)
+        with self.assertRaises(ShipnoteConfigError):
+            bootstrap_repo(repo_path=repo, init_git=False)
 
+    @slow
     def test_bootstrap_can_initialize_git(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp:
-            repo = Path(tmp) / "repo"
-            repo.mkdir(parents=True, exist_ok=True)
-            result = bootstrap_repo(repo_path=repo, init_git=True)
-            self.assertTrue(result.git_initialized)
-            self.assertTrue((repo / ".git").exists())
+        repo = self.root / "repo"
+        repo.mkdir(parents=True, exist_ok=True)
+        result = bootstrap_repo(repo_path=repo, init_git=True)
+        self.assertTrue(result.git_initialized)
+        self.assertTrue((repo / ".git").exists())
+
+    def test_bootstrap_reports_missing_git_binary_as_config_error(self) -> None:
+        repo = self.root / "repo"
+        repo.mkdir(parents=True, exist_ok=True)
+        with patch("shipnote.scaffold.subprocess.run", side_effect=FileNotFoundError("git")):
+            with self.assertRaises(ShipnoteConfigError):
+                bootstrap_repo(repo_path=repo, init_git=True)
+
+    def test_rerun_without_force_is_a_no_op_until_a_template_is_missing(self) -> None:
+        repo = self._marked_git_repo()
+        first = bootstrap_repo(repo_path=repo, poll_interval_seconds=45)
+        config_text = first.config_path.read_text(encoding="utf-8")
+
+        with patch("shipnote.scaffold._config_yaml_from_repo_config") as render:
+            second = bootstrap_repo(repo_path=repo, poll_interval_seconds=90)
+        render.assert_not_called()
+        self.assertFalse(second.created_config)
+        self.assertFalse(second.updated_config)
+        self.assertEqual(second.template_count_written, 0)
+        self.assertEqual(first.config_path.read_text(encoding="utf-8"), config_text)
+
+        (repo / ".shipnote" / "templates" / "authority.md").unlink()
+        with patch("shipnote.scaffold._config_yaml_from_repo_config") as render:
+            with patch("shipnote.scaffold._write_bytes_atomic", wraps=_write_bytes_atomic) as atomic:
+                third = bootstrap_repo(repo_path=repo)
+        render.assert_not_called()
+        self.assertEqual(third.template_count_written, 1)
+        atomic.assert_called_once()
+        self.assertTrue((repo / ".shipnote" / "templates" / "authority.md").exists())
+
+    def test_bundled_templates_are_read_once_and_cover_standard_set(self) -> None:
+        bundled = _get_bundled_templates()
+        self.assertIs(_get_bundled_templates(), bundled)
+        names = [name for name, _ in bundled]
+        self.assertEqual(names, sorted(names))
+        self.assertTrue(set(STANDARD_TEMPLATE_FILES).issubset(names))
+        self.assertTrue(all(data.startswith(b"---") for _, data in bundled))
+
+    def test_bundled_template_paths_supports_zip_backed_packages(self) -> None:
+        archive = self.root / "templates.zip"
+        with zipfile.ZipFile(archive, "w") as zf:
+            for name in ("growth.md", "authority.md", "README.txt"):
+                zf.writestr(name, "---\n")
+        with zipfile.ZipFile(archive) as zf:
+            with patch("shipnote.scaffold._templates_root", return_value=zipfile.Path(zf)):
+                names = [item.name for item in _bundled_template_paths()]
+
+        self.assertEqual(names, ["authority.md", "growth.md"])
+
+    def test_yaml_quote_escapes_only_when_needed(self) -> None:
+        self.assertEqual(_yaml_quote("plain text"), '"plain text"')
+        self.assertEqual(_yaml_quote('say "hi" \\ bye'), '"say \\"hi\\" \\\\ bye"')
 
 
 if __name__ == "__main__":
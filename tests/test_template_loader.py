@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import os
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from tests._support import TempRootTestCase
+from shipnote import template_loader
+from shipnote.errors import ShipnoteConfigError
+from shipnote.template_loader import (
+    STANDARD_TEMPLATE_FILES,
+    _parse_frontmatter,
+    clear_template_cache,
+    load_templates,
+    missing_standard_templates,
+)
+
+
+def _write_template(path: Path, name: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(f"---\nname: {name}\ncontent_type: authority\n---\nBody\n", encoding="utf-8")
+
+
+class TemplateLoaderTests(TempRootTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        clear_template_cache()
+
+    def test_parse_frontmatter_splits_metadata_and_body(self) -> None:
+        raw = "---\nname: Authority\n# comment\ncontent_type: authority\n---\n\nHook line\n---\nMore\n"
+
+        frontmatter, body = _parse_frontmatter(raw, "authority.md")
+
+        self.assertEqual(frontmatter, {"name": "Authority", "content_type": "authority"})
+        self.assertEqual(body, "Hook line\n---\nMore")
+
+    def test_parse_frontmatter_accepts_crlf_line_endings(self) -> None:
+        raw = "---\r\nname: A\r\ncontent_type: a\r\n---\r\nBody\r\n"
+
+        frontmatter, body = _parse_frontmatter(raw, "a.md")
+
+        self.assertEqual(frontmatter, {"name": "A", "content_type": "a"})
+        self.assertEqual(body, "Body")
+
+    def test_parse_frontmatter_rejects_missing_or_unclosed_block(self) -> None:
+        with self.assertRaises(ShipnoteConfigError):
+            _parse_frontmatter("name: A\n", "a.md")
+        with self.assertRaises(ShipnoteConfigError):
+            _parse_frontmatter("---\nname: A\ncontent_type: a\n", "a.md")
+
+    def test_load_templates_reads_markdown_files(self) -> None:
+        template_dir = self.root
+        (template_dir / "authority.md").write_text(
+            "---\nname: Authority\ncontent_type: authority\n---\nBody\n",
+            encoding="utf-8",
+        )
+        (template_dir / "notes.txt").write_text("ignored", encoding="utf-8")
+
+        templates = load_templates(template_dir)
+
+        self.assertEqual(list(templates), ["authority.md"])
+        self.assertEqual(templates["authority.md"].body, "Body")
+
+    def test_load_templates_reuses_cache_until_file_changes(self) -> None:
+        template_dir = self.root
+        path = template_dir / "authority.md"
+        _write_template(path, "First")
+
+        first = load_templates(template_dir)
+        with patch.object(template_loader, "_parse_frontmatter", side_effect=AssertionError("parsed")):
+            self.assertEqual(load_templates(template_dir), first)
+
+        _write_template(path, "Second version")
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        reloaded = load_templates(template_dir)
+
+        self.assertEqual(reloaded["authority.md"].frontmatter["name"], "Second version")
+
+    def test_load_templates_notices_atomic_replace_with_same_mtime_and_size(self) -> None:
+        path = self.root / "authority.md"
+        _write_template(path, "First")
+        load_templates(self.root)
+
+        stat = path.stat()
+        replacement = self.root / "authority.md.tmp"
+        _write_template(replacement, "Other")
+        os.utime(replacement, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        os.replace(replacement, path)
+
+        self.assertEqual(load_templates(self.root)["authority.md"].frontmatter["name"], "Other")
+
+    def test_load_templates_picks_up_added_files(self) -> None:
+        template_dir = self.root
+        _write_template(template_dir / "authority.md", "Authority")
+        self.assertEqual(list(load_templates(template_dir)), ["authority.md"])
+
+        _write_template(template_dir / "growth.md", "Growth")
+
+        self.assertEqual(list(load_templates(template_dir)), ["authority.md", "growth.md"])
+
+    def test_load_templates_hands_out_copies_of_cached_frontmatter(self) -> None:
+        _write_template(self.root / "authority.md", "Authority")
+
+        load_templates(self.root)["authority.md"].frontmatter["name"] = "Mutated"
+
+        self.assertEqual(load_templates(self.root)["authority.md"].frontmatter["name"], "Authority")
+
+    def test_load_templates_keys_relative_dirs_on_their_resolved_path(self) -> None:
+        for name in ("a", "b"):
+            _write_template(self.root / name / "templates" / "authority.md", name.upper())
+        previous_cwd = os.getcwd()
+        try:
+            os.chdir(self.root / "a")
+            from_a = load_templates(Path("templates"))
+            os.chdir(self.root / "b")
+            from_b = load_templates(Path("templates"))
+        finally:
+            os.chdir(previous_cwd)
+
+        self.assertEqual(from_a["authority.md"].frontmatter["name"], "A")
+        self.assertEqual(from_b["authority.md"].frontmatter["name"], "B")
+        self.assertEqual(from_b["authority.md"].path, (self.root / "b/templates/authority.md").resolve())
+
+    def test_load_templates_cache_evicts_least_recently_used_dirs(self) -> None:
+        dirs = [self.root / f"t{index}" for index in range(template_loader._TEMPLATE_CACHE_SIZE + 1)]
+        for directory in dirs:
+            _write_template(directory / "authority.md", directory.name)
+            load_templates(directory)
+
+        self.assertEqual(len(template_loader._TEMPLATE_CACHE), template_loader._TEMPLATE_CACHE_SIZE)
+        self.assertNotIn(dirs[0].resolve(), template_loader._TEMPLATE_CACHE)
+        self.assertIn(dirs[-1].resolve(), template_loader._TEMPLATE_CACHE)
+
+    def test_missing_standard_templates_keeps_standard_order(self) -> None:
+        templates = {name: None for name in ("growth.md", "authority.md", "custom.md")}
+
+        missing = missing_standard_templates(templates)  # type: ignore[arg-type]
+
+        self.assertEqual(missing, [n for n in STANDARD_TEMPLATE_FILES if n not in templates])
+        self.assertEqual(missing_standard_templates(dict.fromkeys(STANDARD_TEMPLATE_FILES)), [])  # type: ignore[arg-type]
+
+
+if __name__ == "__main__":
+    unittest.main()